@@ -0,0 +1,88 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from numpy import array, roll, minimum, maximum, bincount
+
+def FltDiversity(C):
+    """
+    FltDiversity computes the diversity of a population of float chromosomes
+    Output:
+      d -- standard deviation of bases across population, averaged over bases
+           (this is also the 'div' recorded by history sinks; see GenStats)
+    """
+    return array(C, dtype=float).std(axis=0).mean()
+
+
+def OrdEdges(C):
+    """
+    OrdEdges computes the edge-frequency matrix of a population of ordered chromosomes
+    Output:
+      E -- nbases x nbases matrix where E[i,j] (i < j) is the number of chromosomes
+           with i and j adjacent (tours are closed); E[i,j] is zero if i >= j
+    """
+    C = array(C, dtype=int)
+    nbases = C.shape[1]
+    D = roll(C, -1, axis=1)
+    K = minimum(C, D) * nbases + maximum(C, D)
+    return bincount(K.ravel(), minlength=nbases*nbases).reshape(nbases, nbases)
+
+
+def OrdDiversity(C):
+    """
+    OrdDiversity computes the diversity of a population of ordered chromosomes
+    Output:
+      d -- 1 - (mean frequency of the edges of chromosomes) / ninds; i.e. zero if all
+           chromosomes have the same edges and 1 - 1/ninds if no edge is shared
+    """
+    E = OrdEdges(C)
+    return 1.0 - (E**2.0).sum() / (E.sum() * float(len(C)))
+
+
+class AdaptiveRates(object):
+    """
+    AdaptiveRates computes probabilities of crossover and mutation from the diversity of
+    the population
+    Input:
+      divFcn -- diversity function d(C); e.g. FltDiversity or OrdDiversity
+      pc     -- (min, max) probabilities of crossover
+      pm     -- (min, max) probabilities of mutation
+      every  -- number of generations between updates of rates
+    Note:
+      with r = d / d0 (at most 1), where d0 is the diversity of the initial population,
+      the rates are pc = pcmin + (pcmax - pcmin) * r and pm = pmmax - (pmmax - pmmin) * r;
+      i.e. crossover is favoured while the population is diverse and mutation after it
+      collapses. Rates and relative diversities are kept in PC, PM and R (one value per
+      call) and the object is reset when called with gen == 0. Give it to Evolve as adapt
+    """
+
+    def __init__(self, divFcn, pc=(0.6, 0.95), pm=(0.01, 0.2), every=1):
+        self.divFcn = divFcn
+        self.pcmin, self.pcmax = pc
+        self.pmmin, self.pmmax = pm
+        self.every  = every
+
+    def __call__(self, gen, C, Y):
+        """
+        computes the rates for the next generation
+        Input:
+          gen -- generation number
+          C   -- chromosomes/population
+          Y   -- objective values
+        Output:
+          pc -- probability of crossover
+          pm -- probability of mutation
+        """
+        if gen == 0:
+            self.d0, self.PC, self.PM, self.R = None, [], [], []
+        if self.d0 == None or gen % self.every == 0:
+            d = self.divFcn(C)
+            if self.d0 == None: self.d0 = max(d, 1e-14)
+            r = min(d / self.d0, 1.0)
+            self.pc = self.pcmin + (self.pcmax - self.pcmin) * r
+            self.pm = self.pmmax - (self.pmmax - self.pmmin) * r
+            self.r  = r
+        self.PC.append(self.pc)
+        self.PM.append(self.pm)
+        self.R.append(self.r)
+        return self.pc, self.pm
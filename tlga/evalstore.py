@@ -0,0 +1,77 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import sqlite3, hashlib, time
+
+from numpy import array, nan
+
+class EvalStore(object):
+    """
+    EvalStore is a persistent archive of objective values shared across runs and processes
+    Input:
+      filename -- SQLite database file
+      problem  -- problem identifier; e.g. name of objective function + mesh + parameters
+      maxsize  -- maximum number of entries (of all problems); the oldest are evicted
+      timeout  -- time (seconds) to wait for locks held by other processes
+    Note:
+      entries are keyed by problem and by a hash of dtype, size and contents of chromosomes.
+      Each process (e.g. parallel worker) must create its own EvalStore; many processes
+      can read and write the same file at the same time (write-ahead log journal)
+    """
+
+    def __init__(self, filename, problem, maxsize=1000000, timeout=60.0):
+        self.problem = problem
+        self.maxsize = maxsize
+        self.conn = sqlite3.connect(filename, timeout=timeout)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        with self.conn:
+            self.conn.execute('''CREATE TABLE IF NOT EXISTS evals (problem TEXT, key TEXT,
+                y REAL, stamp REAL, PRIMARY KEY (problem, key))''')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS evals_stamp ON evals (stamp)')
+
+    def Keys(self, C):
+        """
+        Keys computes the keys of chromosomes
+        """
+        return [hashlib.sha1(c.dtype.str + str(c.shape) + c.tobytes()).hexdigest() for c in C]
+
+    def Get(self, C):
+        """
+        Get returns the stored objective values of chromosomes or nan if not found
+        """
+        C = array(C)
+        keys = self.Keys(C)
+        found = {}
+        for a in range(0, len(keys), 500):
+            K = keys[a:a+500]
+            sql = 'SELECT key, y FROM evals WHERE problem=? AND key IN (%s)' % ','.join('?'*len(K))
+            found.update(self.conn.execute(sql, [self.problem] + K).fetchall())
+        return array([found.get(key, nan) for key in keys], dtype=float)
+
+    def Put(self, C, Y):
+        """
+        Put stores objective values of chromosomes and evicts the oldest entries if needed
+        """
+        C = array(C)
+        now = time.time()
+        rows = [(self.problem, key, float(y), now) for key, y in zip(self.Keys(C), Y)]
+        with self.conn:
+            self.conn.executemany('INSERT OR REPLACE INTO evals VALUES (?,?,?,?)', rows)
+            n, = self.conn.execute('SELECT COUNT(*) FROM evals').fetchone()
+            if n > self.maxsize:
+                self.conn.execute('''DELETE FROM evals WHERE rowid IN
+                    (SELECT rowid FROM evals ORDER BY stamp LIMIT ?)''', (n - self.maxsize,))
+
+    def Size(self):
+        """
+        Size returns the number of entries of this problem
+        """
+        return self.conn.execute('SELECT COUNT(*) FROM evals WHERE problem=?',
+            (self.problem,)).fetchone()[0]
+
+    def Close(self):
+        """
+        Close closes the database
+        """
+        self.conn.close()
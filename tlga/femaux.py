@@ -4,9 +4,7 @@
 
 import traceback, warnings
 
-from numpy import isnan
-
-from FEMsolver import FEMsolver
+from numpy import array, zeros, arange, maximum, isnan
 
 def RunFEMsolverSteady(mesh, etype, prms, vb={}, eb={}):
     """
@@ -23,6 +21,7 @@ def RunFEMsolverSteady(mesh, etype, prms, vb={}, eb={}):
     Notes:
       this function also calls calc_secondary() method of sol
     """
+    from FEMsolver import FEMsolver
     warnings.filterwarnings('error')
     try:
         sol = FEMsolver(mesh, etype, prms)
@@ -35,3 +34,58 @@ def RunFEMsolverSteady(mesh, etype, prms, vb={}, eb={}):
         formatted_lines = traceback.format_exc().splitlines()
         return None, 'ERROR: ' + formatted_lines[-1]
     return None, 'wrong line reached in femaux.py'
+
+
+class MultiFidelity(object):
+    """
+    MultiFidelity evaluates populations with cheap (e.g. coarse mesh) models first and
+    promotes the most promising individuals to the expensive (e.g. fine mesh) models
+    Input:
+      oFcns -- objective functions y(c) (or Y(C) if batch) from the lowest to the highest
+               fidelity; e.g. functions calling RunFEMsolverSteady with a coarse and a fine
+               mesh or with relaxed and strict solver settings
+      frac  -- fraction of individuals, with the best values at one level, promoted to the
+               next level; a number or a list with one fraction for each promotion
+      batch -- oFcns take a matrix with chromosomes (rows) and return all objective values
+    Note:
+      Evaluate can be given to Evolve as oFcn with batch=True. The fidelity level of each
+      row of the last call is kept in L and the number of evaluations at each level in
+      neval. Values of lower fidelity are raised to the largest value of higher fidelity
+      (if smaller); thus, within one call, Fitness and SortPop never rank an individual
+      above another one which was evaluated at a higher fidelity. Since these values are
+      only comparable within the same call, they must not be cached or stored: Evolve
+      refuses dup, store and surr with this oFcn (see cacheable)
+    """
+
+    cacheable = False # objective values depend on the other individuals of the same call
+
+    def __init__(self, oFcns, frac=0.25, batch=False):
+        self.oFcns = oFcns
+        self.frac  = frac
+        if not isinstance(frac, (list, tuple)): self.frac = [float(frac)] * (len(oFcns) - 1)
+        if len(self.frac) != len(oFcns) - 1:
+            raise Exception('frac must be a number or a list with %d fractions' % (len(oFcns) - 1))
+        self.batch = batch
+        self.L     = None
+        self.neval = zeros(len(oFcns), dtype=int)
+
+    def Evaluate(self, C):
+        """
+        Evaluate computes the objective values of all chromosomes (rows of C)
+        """
+        C = array(C)
+        Y = zeros(len(C))
+        L = zeros(len(C), dtype=int)
+        I = arange(len(C)) # individuals evaluated at the current level
+        for l, oFcn in enumerate(self.oFcns):
+            if l > 0:
+                n = max(1, int(self.frac[l-1] * len(I) + 0.5))
+                I = I[Y[I].argsort()[:n]] # most promising individuals
+            if self.batch: Y[I] = oFcn(C[I])
+            else:          Y[I] = [oFcn(c) for c in C[I]]
+            L[I] = l
+            self.neval[l] += len(I)
+        for l in range(len(self.oFcns)-2, -1, -1):
+            Y[L == l] = maximum(Y[L == l], Y[L > l].max())
+        self.L = L
+        return Y
@@ -0,0 +1,64 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+class IndexedHeap(object):
+    """
+    IndexedHeap is a binary max-heap over the indices of a population
+    Input:
+      Y -- keys (objective values); Top() returns the index with the largest key (worst)
+    Note:
+      the position of each index in the heap is stored, thus the key of any
+      individual can be changed in O(log n) (e.g. when the worst is replaced)
+    """
+
+    def __init__(self, Y):
+        self.Y = [float(y) for y in Y]     # keys
+        self.H = range(len(self.Y))        # heap of indices
+        self.pos = range(len(self.Y))      # position of each index in H
+        for k in reversed(range(len(self.H) / 2)):
+            self.Down(k)
+
+    def Top(self):
+        """
+        Top returns the index with the largest key
+        """
+        return self.H[0]
+
+    def Key(self, i):
+        """
+        Key returns the key of index i
+        """
+        return self.Y[i]
+
+    def Update(self, i, y):
+        """
+        Update changes the key of index i and restores the heap
+        """
+        old = self.Y[i]
+        self.Y[i] = float(y)
+        if y > old: self.Up(self.pos[i])
+        else:       self.Down(self.pos[i])
+
+    def Swap(self, k, l):
+        H = self.H
+        H[k], H[l] = H[l], H[k]
+        self.pos[H[k]], self.pos[H[l]] = k, l
+
+    def Up(self, k):
+        H, Y = self.H, self.Y
+        while k > 0:
+            p = (k - 1) / 2
+            if Y[H[k]] <= Y[H[p]]: break
+            self.Swap(k, p)
+            k = p
+
+    def Down(self, k):
+        H, Y, n = self.H, self.Y, len(self.H)
+        while True:
+            l, r, m = 2*k + 1, 2*k + 2, k
+            if l < n and Y[H[l]] > Y[H[m]]: m = l
+            if r < n and Y[H[r]] > Y[H[m]]: m = r
+            if m == k: break
+            self.Swap(k, m)
+            k = m
@@ -0,0 +1,150 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import time
+
+from numpy import array, loadtxt, fromfile, atleast_2d
+
+from adaptive import FltDiversity
+
+# columns always present in a history record
+HISTKEYS = ['gen', 'best', 'mean', 'worst', 'div', 'time']
+
+def GenStats(C, Y):
+    """
+    GenStats computes statistics of one generation
+    Input:
+      C -- chromosomes/population
+      Y -- objective values
+    Output:
+      best  -- best (smallest) objective value
+      mean  -- mean objective value
+      worst -- worst (largest) objective value
+      div   -- diversity: standard deviation of bases across population, averaged over bases
+               (see FltDiversity)
+    """
+    Y = array(Y)
+    return Y.min(), Y.mean(), Y.max(), FltDiversity(C)
+
+
+class HistMemory(object):
+    """
+    HistMemory keeps per-generation records in memory
+    Note:
+      any object with Append(gen, C, Y, info) and Flush() methods can be given
+      to Evolve as history sink; this one is convenient for small runs and tests.
+      As in HistWriter, the keys are HISTKEYS followed by the keys of the 'info'
+      dictionary given in the first call to Append; missing values are recorded as nan
+    """
+
+    def __init__(self):
+        self.t0  = time.time()
+        self.res = None
+
+    def Append(self, gen, C, Y, info={}):
+        """
+        Append records one generation
+         gen  -- generation number
+         C    -- chromosomes/population
+         Y    -- objective values
+         info -- dictionary with extra values (e.g. rates) to be recorded
+        """
+        if self.res == None:
+            self.res = dict([(key, []) for key in HISTKEYS + info.keys()])
+        best, mean, worst, div = GenStats(C, Y)
+        rec = dict(gen=gen, best=best, mean=mean, worst=worst, div=div, time=time.time()-self.t0)
+        rec.update(info)
+        for key, vals in self.res.items():
+            vals.append(rec.get(key, float('nan')))
+
+    def Flush(self):
+        pass
+
+    def Get(self, key):
+        """
+        Get returns all values recorded under key
+        """
+        return array(self.res[key])
+
+
+class HistWriter(object):
+    """
+    HistWriter appends per-generation records to a file as the run proceeds
+    Input:
+      fnkey   -- filename (csv) or filename key (bin)
+      fmt     -- 'csv': text file with one line per generation
+                 'bin': columnar files <fnkey>-<column>.bin with raw float64 values
+                        plus <fnkey>.cols with the names of columns
+      bufsize -- maximum number of records kept in memory before writing
+    Note:
+      existing files are truncated; columns are HISTKEYS followed by the (sorted)
+      keys of the 'info' dictionary given in the first call to Append
+    """
+
+    def __init__(self, fnkey, fmt='csv', bufsize=64):
+        if not fmt in ['csv', 'bin']: raise Exception('fmt must be csv or bin')
+        self.fnkey   = fnkey
+        self.fmt     = fmt
+        self.bufsize = max(1, bufsize)
+        self.keys    = None
+        self.buf     = []
+        self.t0      = time.time()
+
+    def Append(self, gen, C, Y, info={}):
+        """
+        Append records one generation and writes to file if buffer is full
+         gen  -- generation number
+         C    -- chromosomes/population
+         Y    -- objective values
+         info -- dictionary with extra values (e.g. rates) to be recorded
+        """
+        if self.keys == None:
+            self.keys = HISTKEYS + sorted(info.keys())
+            self.Start()
+        best, mean, worst, div = GenStats(C, Y)
+        rec = [gen, best, mean, worst, div, time.time()-self.t0]
+        rec += [info.get(key, float('nan')) for key in self.keys[len(HISTKEYS):]]
+        self.buf.append(rec)
+        if len(self.buf) >= self.bufsize: self.Flush()
+
+    def Start(self):
+        """
+        Start truncates files and writes header
+        """
+        if self.fmt == 'csv':
+            with open(self.fnkey, 'w') as f: f.write(','.join(self.keys) + '\n')
+            return
+        with open(self.fnkey + '.cols', 'w') as f: f.write('\n'.join(self.keys) + '\n')
+        for key in self.keys:
+            open(self.fnkey + '-' + key + '.bin', 'wb').close()
+
+    def Flush(self):
+        """
+        Flush writes buffered records to file
+        """
+        if len(self.buf) == 0: return
+        if self.fmt == 'csv':
+            with open(self.fnkey, 'a') as f:
+                for rec in self.buf:
+                    f.write(','.join(['%.17g' % v for v in rec]) + '\n')
+        else:
+            R = array(self.buf, dtype=float)
+            for j, key in enumerate(self.keys):
+                with open(self.fnkey + '-' + key + '.bin', 'ab') as f:
+                    R[:,j].tofile(f)
+        self.buf = []
+
+
+def ReadHist(fnkey, fmt='csv'):
+    """
+    ReadHist reads history file(s) written by HistWriter
+    Output:
+      res -- dictionary mapping column name to array of values
+    """
+    if fmt == 'csv':
+        with open(fnkey, 'r') as f: keys = f.readline().strip().split(',')
+        R = atleast_2d(loadtxt(fnkey, delimiter=',', skiprows=1))
+        return dict([(key, R[:,j]) for j, key in enumerate(keys)])
+    with open(fnkey + '.cols', 'r') as f: keys = f.read().split()
+    return dict([(key, fromfile(fnkey + '-' + key + '.bin', dtype=float)) for key in keys])
@@ -2,9 +2,11 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
-from numpy import array, zeros, ones, hstack, delete, insert, arange
+from numpy import array, zeros, ones, hstack, delete, insert, arange, lexsort, cumsum, inf
+from numpy import atleast_2d, minimum, maximum, where, clip, roll, sort, searchsorted
+from numpy import packbits, unpackbits, uint8, bitwise_xor, unique
 
-from randnums import FltRand, IntRand, FlipCoin
+from randnums import FltRand, FltRandArray, IntRand, FlipCoin, NumFlips, Permutations
 
 def SimpleChromo(x, nbases):
     """
@@ -38,6 +40,70 @@ def SimpleChromo(x, nbases):
     return c
 
 
+def SimpleChromoPop(X, nbases):
+    """
+    SimpleChromoPop generates all chromosomes at once (see SimpleChromo)
+    Input:
+      X      -- values to be split: ninds array (one gene) or ninds x ngenes matrix
+      nbases -- number of bases of each gene
+    Output:
+      C -- population: ninds x (ngenes*nbases) array; row i corresponds to SimpleChromo(X[i])
+    """
+    X = array(X, dtype=float)
+    if X.ndim == 1: X = X[:,None]
+    ninds, ngenes = X.shape
+    V = FltRandArray((ninds, ngenes, nbases))
+    C = X[:,:,None] * V / V.sum(axis=2)[:,:,None]
+    return C.reshape(ninds, ngenes * nbases)
+
+
+def OrdChromoPop(ninds, nbases):
+    """
+    OrdChromoPop generates all chromosomes corresponding to random ordered sequences
+    Output:
+      C -- population: ninds x nbases array; each row is a permutation of 0..nbases-1
+    """
+    return Permutations(ninds, nbases)
+
+
+def RealChromoPop(ninds, xmin, xmax):
+    """
+    RealChromoPop generates all chromosomes with one base per variable (direct encoding)
+    Input:
+      ninds -- number of individuals
+      xmin  -- lower bounds of variables (list or array)
+      xmax  -- upper bounds of variables (list or array)
+    Output:
+      C -- population: ninds x nvars array with uniform values within bounds
+    """
+    xmin, xmax = array(xmin, dtype=float), array(xmax, dtype=float)
+    return xmin + FltRandArray((ninds, len(xmin))) * (xmax - xmin)
+
+
+def BinChromoPop(ninds, nbits):
+    """
+    BinChromoPop generates all chromosomes with random bits packed into bytes
+    Output:
+      C -- population: ninds x nbytes array of uint8 with nbytes = ceil(nbits/8); bit i of
+           a chromosome is the bit (7 - i%8) of byte i/8 and the padding bits are zero
+    """
+    return BinPack(FltRandArray((ninds, nbits)) < 0.5)
+
+
+def BinPack(B):
+    """
+    BinPack packs bits (rows of B with zeros and ones) into bytes (see BinChromoPop)
+    """
+    return packbits(array(B, dtype=uint8), axis=-1)
+
+
+def BinUnpack(C, nbits):
+    """
+    BinUnpack unpacks chromosomes (see BinChromoPop) into arrays with zeros and ones
+    """
+    return unpackbits(C, axis=-1)[...,:nbits]
+
+
 def Fitness(Y):
     """
     Fitness function: map objective function into [0, 1]
@@ -118,6 +184,30 @@ def SUSselect(M, n, pb=None):
     return S
 
 
+def TournamentSelect(F, n, k=2, replace=True):
+    """
+    TournamentSelect selects n individuals by tournaments among k competitors
+    Input:
+      F       -- fitnesses (larger is better); the population does not need to be sorted
+      n       -- number of individuals to select
+      k       -- tournament size
+      replace -- with replacement: competitors are drawn independently at random;
+                 otherwise, competitors are taken from shuffled copies of the population
+                 such that all individuals take part in about the same number of tournaments
+    Output:
+      S -- selected individuals (indices)
+    Note:
+      all tournaments are run at once on an n x k matrix of indices
+    """
+    ninds = len(F)
+    if replace:
+        T = IntRand(0, ninds, (n, k))
+    else:
+        ncopies = (n * k - 1) / ninds + 1
+        T = Permutations(ncopies, ninds).ravel()[:n*k].reshape(n, k)
+    return T[arange(n), F[T].argmax(axis=1)]
+
+
 def FilterPairs(S):
     """
     FilterPairs generates 2 x ninds/2 lists from selected individuals
@@ -137,47 +227,265 @@ def FilterPairs(S):
     return A, B
 
 
-def FltCrossover(A, B, pc=0.8):
+def Duplicates(C):
+    """
+    Duplicates finds repeated chromosomes by hashing their contents
+    Input:
+      C -- chromosomes/population
+    Output:
+      D -- D[i] == True if C[i] equals some C[j] with j < i
+    """
+    D = zeros(len(C), dtype=bool)
+    seen = set()
+    for i, c in enumerate(C):
+        key = c.tobytes()
+        if key in seen: D[i] = True
+        else: seen.add(key)
+    return D
+
+
+def NonDominatedSort(Y):
+    """
+    NonDominatedSort sorts individuals into fronts (multi-objective minimisation)
+    Input:
+      Y -- objective values: ninds x nobj array
+    Output:
+      R -- front index (rank) of each individual; 0 == non-dominated (Pareto) front
+    Note:
+      the domination matrix D[i,j] == 'i dominates j' is built with one vectorized
+      comparison per objective; fronts are then peeled by updating domination counts
+    """
+    Y = array(Y, dtype=float)
+    ninds, nobj = Y.shape
+    le = ones((ninds, ninds), dtype=bool)
+    lt = zeros((ninds, ninds), dtype=bool)
+    for k in range(nobj):
+        a, b = Y[:,k,None], Y[None,:,k]
+        le &= a <= b
+        lt |= a < b
+    D = le & lt                     # D[i,j] == True if i dominates j
+    N = D.sum(axis=0)               # number of individuals dominating j
+    R = zeros(ninds, dtype=int) - 1 # ranks
+    r = 0
+    front = (N == 0).nonzero()[0]
+    while len(front) > 0:
+        R[front] = r
+        N[front] = -1
+        N -= D[front].sum(axis=0)
+        front = (N == 0).nonzero()[0]
+        r += 1
+    return R
+
+
+def CrowdingDistance(Y, R):
+    """
+    CrowdingDistance computes the crowding distance of individuals within their fronts
+    Input:
+      Y -- objective values: ninds x nobj array
+      R -- front index (rank) of each individual (see NonDominatedSort)
+    Output:
+      D -- crowding distances; boundary individuals of each front get inf
+    """
+    Y = array(Y, dtype=float)
+    ninds, nobj = Y.shape
+    D = zeros(ninds)
+    for k in range(nobj):
+        I = lexsort((Y[:,k], R))         # sorted by front and then by objective k
+        r, y = R[I], Y[I,k]
+        first = hstack([[True], r[1:] != r[:-1]])
+        last  = hstack([r[1:] != r[:-1], [True]])
+        fid   = cumsum(first) - 1        # front of each sorted item
+        span  = (y[last] - y[first])[fid]
+        mid   = (~first & ~last & (span > 0)).nonzero()[0]
+        D[I[mid]] += (y[mid+1] - y[mid-1]) / span[mid]
+        D[I[first | last]] = inf
+    return D
+
+
+def FltCrossover(A, B, pc=0.8, rec=None):
     """
     FltCrossover performs the crossover in a pair of individuals with float point numbers
     Input:
-      A  -- chromosome of parent
-      B  -- chromosome of parent
-      pc -- probability of crossover
+      A   -- chromosome of parent
+      B   -- chromosome of parent
+      pc  -- probability of crossover
+      rec -- [optional] dictionary where 'cx' is set to True if crossover happened or
+             False if a and b are copies of A and B (see Evolve: dFcn)
     Output:
       a -- chromosome of offspring
       b -- chromosome of offspring
     """
-    if FlipCoin(pc):
+    cx = FlipCoin(pc)
+    if cx:
         nbases = len(A)
         pos = IntRand(1, nbases-1)
         a = hstack([A[:pos], B[pos:]])
         b = hstack([B[:pos], A[pos:]])
     else:
         a, b = A.copy(), B.copy()
+    if rec != None: rec['cx'] = cx
     return a, b
 
 
-def FltMutation(c, pm=0.01, coef=1.1):
+def FltMutation(c, pm=0.01, coef=1.1, rec=None):
     """
     FltMutation performs mutation in an individual with float point numbers
     Input:
       c    -- chromosome
       pm   -- probability of mutation
       coef -- coefficient to increase or decrease bases
+      rec  -- [optional] dictionary where 'mu' is set to True if mutation happened and
+              'pos' to the list of modified positions (see Evolve: dFcn)
     Output:
       c -- modified (or not) chromosome
     """
-    if FlipCoin(pm):
+    mu = FlipCoin(pm)
+    if mu:
         nbases = len(c)
         bmax = max(c)
         pos = IntRand(0, nbases)
         if FlipCoin(0.5): c[pos] += bmax * coef
         else:             c[pos] -= bmax * coef
+    if rec != None:
+        rec['mu'] = mu
+        rec['pos'] = [pos] if mu else []
     return c
 
 
-def OrdCrossover(A, B, pc=0.8, method='OX1', cut1=None, cut2=None):
+def SBXCrossover(A, B, xmin, xmax, pc=0.9, eta=15.0, pv=0.5):
+    """
+    SBXCrossover performs the (bounded) simulated binary crossover of real-coded chromosomes
+    Input:
+      A    -- chromosomes of parents: npairs x nvars array or a single chromosome
+      B    -- chromosomes of parents: npairs x nvars array or a single chromosome
+      xmin -- lower bounds of variables
+      xmax -- upper bounds of variables
+      pc   -- probability of crossover of each pair
+      eta  -- distribution index; large values create offspring close to parents
+      pv   -- probability of crossover of each variable
+    Output:
+      a -- chromosomes of offspring (same shape as A)
+      b -- chromosomes of offspring (same shape as B)
+    Note:
+      all pairs are processed at once; see Deb and Agrawal (1995) Complex Systems 9:115-148
+    """
+    shape = A.shape
+    A, B = atleast_2d(A).astype(float), atleast_2d(B).astype(float)
+    npairs, nvars = A.shape
+    xl = array(xmin, dtype=float) * ones(nvars)
+    xu = array(xmax, dtype=float) * ones(nvars)
+    y1, y2 = minimum(A, B), maximum(A, B)
+    dy = maximum(y2 - y1, 1e-14)
+    u = FltRandArray((npairs, nvars))
+    e = 1.0 / (eta + 1.0)
+    def betaq(beta):
+        alpha = 2.0 - beta**(-(eta + 1.0))
+        return where(u <= 1.0/alpha, (u * alpha)**e, (1.0 / maximum(2.0 - u * alpha, 1e-14))**e)
+    c1 = 0.5 * ((y1 + y2) - betaq(1.0 + 2.0 * (y1 - xl) / dy) * (y2 - y1))
+    c2 = 0.5 * ((y1 + y2) + betaq(1.0 + 2.0 * (xu - y2) / dy) * (y2 - y1))
+    c1, c2 = clip(c1, xl, xu), clip(c2, xl, xu)
+    swap = FltRandArray((npairs, nvars)) < 0.5
+    c1, c2 = where(swap, c2, c1), where(swap, c1, c2)
+    cross = (FltRandArray((npairs, 1)) < pc) & (FltRandArray((npairs, nvars)) < pv) & (y2 - y1 > 1e-14)
+    a, b = where(cross, c1, A), where(cross, c2, B)
+    return a.reshape(shape), b.reshape(shape)
+
+
+def PolyMutation(C, xmin, xmax, pm=0.1, eta=20.0):
+    """
+    PolyMutation performs the (bounded) polynomial mutation of real-coded chromosomes
+    Input:
+      C    -- chromosomes: ninds x nvars array or a single chromosome
+      xmin -- lower bounds of variables
+      xmax -- upper bounds of variables
+      pm   -- probability of mutation of each variable; e.g. 1/nvars
+      eta  -- distribution index; large values create small perturbations
+    Output:
+      C -- modified (or not) chromosomes (a copy)
+    """
+    shape = C.shape
+    C = atleast_2d(C).astype(float)
+    ninds, nvars = C.shape
+    xl = array(xmin, dtype=float) * ones(nvars)
+    xu = array(xmax, dtype=float) * ones(nvars)
+    dx = xu - xl
+    d1, d2 = (C - xl) / dx, (xu - C) / dx
+    u = FltRandArray((ninds, nvars))
+    e = 1.0 / (eta + 1.0)
+    lo = u < 0.5
+    v1 = 2.0 * u + (1.0 - 2.0 * u) * (1.0 - d1)**(eta + 1.0)
+    v2 = 2.0 * (1.0 - u) + 2.0 * (u - 0.5) * (1.0 - d2)**(eta + 1.0)
+    dq = where(lo, maximum(v1, 0.0)**e - 1.0, 1.0 - maximum(v2, 0.0)**e)
+    mut = FltRandArray((ninds, nvars)) < pm
+    C = where(mut, clip(C + dq * dx, xl, xu), C)
+    return C.reshape(shape)
+
+
+def BinCrossover(A, B, nbits, pc=0.8, method='1P', cut=None):
+    """
+    BinCrossover performs the crossover of all pairs of individuals with packed bits
+    Input:
+      A      -- chromosomes of parents: npairs x nbytes array (see BinChromoPop) or a single one
+      B      -- chromosomes of parents: npairs x nbytes array (see BinChromoPop) or a single one
+      nbits  -- number of bits
+      pc     -- probability of crossover of each pair
+      method -- 1P: one-point crossover; UX: uniform crossover
+      cut    -- [1P] position of cut: use None for random values
+    Output:
+      a -- chromosomes of offspring
+      b -- chromosomes of offspring
+    Note:
+      bytes are combined with masks, a = (A & m) | (B & ~m), where the bits of m are one
+      before the cut (1P) or random (UX); thus the cost is O(nbytes) for each pair
+    """
+    if not method in ['1P', 'UX']: raise Exception('method must be 1P or UX')
+    shape = A.shape
+    A, B = atleast_2d(A), atleast_2d(B)
+    npairs, nbytes = A.shape
+    if method == '1P':
+        if cut is None: cut = IntRand(1, nbits, npairs)
+        cut = cut * ones(npairs, dtype=int)
+        q, r = cut / 8, cut % 8
+        m = where(arange(nbytes) < q[:,None], 255, 0).astype(uint8)
+        m[arange(npairs),q] = (255 << (8 - r)) & 255
+    else:
+        m = IntRand(0, 256, (npairs, nbytes)).astype(uint8)
+    m[FltRandArray(npairs) >= pc] = 255 # no crossover
+    a, b = (A & m) | (B & ~m), (B & m) | (A & ~m)
+    return a.reshape(shape), b.reshape(shape)
+
+
+def BinMutation(C, nbits, pm=0.01):
+    """
+    BinMutation performs the bit-flip mutation of individuals with packed bits
+    Input:
+      C     -- chromosomes: ninds x nbytes array (see BinChromoPop) or a single chromosome
+      nbits -- number of bits
+      pm    -- probability of mutation of each bit
+    Output:
+      C -- modified (or not) chromosomes (a copy)
+    Note:
+      only the flipped bits are drawn: their number is a binomial variable and their
+      positions are distinct random values; thus the cost is O(pm * ninds * nbits).
+      If more than half of the bits are flipped, all bits are flipped and the ones
+      which are not flipped are drawn instead
+    """
+    shape = C.shape
+    C = atleast_2d(C).copy()
+    ninds = len(C)
+    n = ninds * nbits
+    k = NumFlips(n, pm)
+    if k > n / 2:
+        C ^= BinPack(ones(nbits))
+        k = n - k
+    P = unique(IntRand(0, n, k)) # positions of flipped bits (without repetition)
+    while len(P) < k: P = unique(hstack([P, IntRand(0, n, k - len(P))]))
+    i, j = P / nbits, P % nbits
+    bitwise_xor.at(C, (i, j / 8), (128 >> (j % 8)).astype(uint8))
+    return C.reshape(shape)
+
+
+def OrdCrossover(A, B, pc=0.8, method='OX1', cut1=None, cut2=None, rec=None):
     """
     OrdCrossover performs the crossover in a pair of individuals with integer numbers
     that correspond to a ordered sequence, e.g. traveling salesman problem
@@ -186,13 +494,23 @@ def OrdCrossover(A, B, pc=0.8, method='OX1', cut1=None, cut2=None):
       B      -- chromosome of parent
       pc     -- probability of crossover
       method -- OX1: order crossover # 1
+                PMX: partially mapped crossover (see PMXPairs)
+                ERX: edge recombination crossover (see ERXPairs); cuts are not used
       cut1   -- position of first cut: use None for random value
       cut2   -- position of second cut: use None for random value
+      rec    -- [optional] dictionary where 'cx' is set to True if crossover happened or
+                False if a and b are copies of A and B (see Evolve: dFcn)
     Output:
       a -- chromosome of offspring
       b -- chromosome of offspring
     """
-    if FlipCoin(pc):
+    if not method in ['OX1', 'PMX', 'ERX']: raise Exception('method must be OX1, PMX or ERX')
+    cx = FlipCoin(pc)
+    if rec != None: rec['cx'] = cx
+    if cx and method != 'OX1':
+        a, b = OrdCrossoverPop(A[None,:], B[None,:], 1.0, method, cut1, cut2)
+        a, b = a[0], b[0]
+    elif cx:
         nbases = len(A)
         if cut1==None: cut1 = IntRand(1, nbases-1)
         if cut2==None: cut2 = IntRand(cut1+1, nbases)
@@ -222,7 +540,127 @@ def OrdCrossover(A, B, pc=0.8, method='OX1', cut1=None, cut2=None):
     return a, b
 
 
-def OrdMutation(c, pm=0.01, method='DM', cut1=None, cut2=None, ins=None):
+def OrdCrossoverPop(A, B, pc=0.8, method='PMX', cut1=None, cut2=None):
+    """
+    OrdCrossoverPop performs the crossover of all pairs of individuals with ordered sequences
+    Input:
+      A      -- chromosomes of parents: npairs x nbases array (e.g. C[idxA] from FilterPairs)
+      B      -- chromosomes of parents: npairs x nbases array (e.g. C[idxB] from FilterPairs)
+      pc     -- probability of crossover of each pair
+      method -- PMX, ERX or OX1 (see OrdCrossover); OX1 is not batched
+      cut1   -- positions of first cut: use None for random values
+      cut2   -- positions of second cut: use None for random values
+    Output:
+      a -- chromosomes of offspring
+      b -- chromosomes of offspring
+    Note:
+      the bases may be any set of distinct integers (they are mapped to 0..nbases-1)
+    """
+    if method == 'OX1':
+        res = [OrdCrossover(A[k], B[k], pc, method, cut1, cut2) for k in range(len(A))]
+        return array([r[0] for r in res]), array([r[1] for r in res])
+    if not method in ['PMX', 'ERX']: raise Exception('method must be OX1, PMX or ERX')
+    npairs, nbases = A.shape
+    L = sort(A[0])
+    P, Q = searchsorted(L, A), searchsorted(L, B)
+    if method == 'PMX':
+        if cut1 is None: cut1 = IntRand(1, nbases-1, npairs)
+        if cut2 is None: cut2 = cut1 + 1 + (FltRandArray(npairs) * (nbases - 1 - cut1)).astype(int)
+        cut1, cut2 = cut1 * ones(npairs, dtype=int), cut2 * ones(npairs, dtype=int)
+        a, b = PMXPairs(P, Q, cut1, cut2), PMXPairs(Q, P, cut1, cut2)
+    else:
+        a, b = ERXPairs(P, Q, P[:,0]), ERXPairs(P, Q, Q[:,0])
+    cross = FltRandArray(npairs) < pc
+    a, b = where(cross[:,None], L[a], A), where(cross[:,None], L[b], B)
+    return a, b
+
+
+def PMXPairs(A, B, cut1, cut2):
+    """
+    PMXPairs performs the partially mapped crossover of all pairs of permutations
+    Input:
+      A    -- npairs x nbases array; each row is a permutation of 0..nbases-1
+      B    -- npairs x nbases array; each row is a permutation of 0..nbases-1
+      cut1 -- positions of first cut of each pair
+      cut2 -- positions of second cut of each pair
+    Output:
+      a -- offspring with a[cut1:cut2] == A[cut1:cut2] and the other bases from B,
+           where conflicts are resolved by the mapping between the two slices
+    Note:
+      starting from a = B, each A[i] in the slice is swapped into position i; with a
+      table of positions of bases, this is O(nbases) for each pair
+    """
+    npairs, nbases = A.shape
+    r = arange(npairs)
+    a = B.copy()
+    pos = zeros((npairs, nbases), dtype=int) # pos[k, v] = position of base v in a[k]
+    pos[r[:,None], a] = arange(nbases)
+    for i in range(cut1.min(), cut2.max()):
+        k = r[(cut1 <= i) & (i < cut2)]
+        v, w = A[k,i], a[k,i]
+        j = pos[k,v]
+        a[k,i], a[k,j] = v, w
+        pos[k,v], pos[k,w] = i, j
+    return a
+
+
+def ERXPairs(A, B, start):
+    """
+    ERXPairs performs the edge recombination crossover of all pairs of permutations
+    Input:
+      A     -- npairs x nbases array; each row is a permutation of 0..nbases-1
+      B     -- npairs x nbases array; each row is a permutation of 0..nbases-1
+      start -- first base of each offspring; e.g. A[:,0]
+    Output:
+      a -- offspring built from the edges of the parents (tours are closed)
+    Note:
+      the next base is the neighbour (in A or B) of the current one with the fewest
+      remaining neighbours (ties are broken randomly) or a random unused base if there is
+      none. The table of neighbours (at most 4) and the list of unused bases are arrays
+      updated in O(1) at each step; thus the cost is O(nbases) for each pair
+    """
+    npairs, nbases = A.shape
+    r = arange(npairs)
+    R = r[:,None]
+    adj = zeros((npairs, nbases, 4), dtype=int) # adj[k, v] = neighbours of base v
+    adj[R,A,0], adj[R,A,1] = roll(A, 1, axis=1), roll(A, -1, axis=1)
+    adj[R,B,2], adj[R,B,3] = roll(B, 1, axis=1), roll(B, -1, axis=1)
+    for i in range(1, 4):
+        for j in range(i):
+            adj[:,:,i][adj[:,:,i] == adj[:,:,j]] = -1
+    deg = (adj >= 0).sum(axis=2) # number of remaining neighbours
+    unused = arange(nbases) * ones((npairs, 1), dtype=int) # unused bases
+    upos = unused.copy() # upos[k, v] = position of base v in unused[k]
+    nunused = nbases
+    a = zeros((npairs, nbases), dtype=int)
+    cur = start.copy()
+    for n in range(nbases):
+        a[:,n] = cur
+
+        # remove current base from list of unused bases
+        nunused -= 1
+        p, last = upos[r,cur], unused[:,nunused]
+        unused[r,p], upos[r,last] = last, p
+
+        # remove current base from tables of its neighbours
+        nb = adj[r,cur]
+        for i in range(4):
+            k = r[nb[:,i] >= 0]
+            v = nb[k,i]
+            hit = adj[k,v] == cur[k,None]
+            adj[k,v] = where(hit, -1, adj[k,v])
+            deg[k,v] -= hit.sum(axis=1)
+        if nunused == 0: break
+
+        # next base
+        D = where(nb >= 0, deg[R,maximum(nb, 0)] + FltRandArray((npairs, 4)), inf)
+        cur = nb[r,D.argmin(axis=1)]
+        none = D.min(axis=1) == inf
+        cur[none] = unused[none,IntRand(0, nunused, npairs)[none]]
+    return a
+
+
+def OrdMutation(c, pm=0.01, method='DM', cut1=None, cut2=None, ins=None, rec=None):
     """
     OrdMutation performs the mutation in an individual with integer numbers
     corresponding to a ordered sequence, e.g. traveling salesman problem
@@ -233,10 +671,14 @@ def OrdMutation(c, pm=0.01, method='DM', cut1=None, cut2=None, ins=None):
       cut1   -- position of first cut: use None for random value
       cut2   -- position of second cut: use None for random value
       ins    -- position in *cut* slice (v) after which the cut subtour (u) is inserted
+      rec    -- [optional] dictionary where 'mu' is set to True if mutation happened and
+                'cut1', 'cut2' and 'ins' to the values used (see Evolve: dFcn)
     Output:
       c -- modified (or not) chromosome
     """
-    if FlipCoin(pm):
+    mu = FlipCoin(pm)
+    if rec != None: rec['mu'] = mu
+    if mu:
         nbases = len(c)
         if cut1==None: cut1 = IntRand(1, nbases-1)
         if cut2==None: cut2 = IntRand(cut1+1, nbases)
@@ -253,6 +695,7 @@ def OrdMutation(c, pm=0.01, method='DM', cut1=None, cut2=None, ins=None):
             ncut = cut2 - cut1 # number of cut items
             nrem = nc - ncut   # number of remaining items
             if ins==None: ins = IntRand(0, nrem)
+            if rec != None: rec.update(cut1=cut1, cut2=cut2, ins=ins)
 
             # auxiliary map: old => new index
             o2n = arange(nc)
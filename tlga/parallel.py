@@ -0,0 +1,215 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import Queue, traceback
+from multiprocessing import Pool, cpu_count
+from multiprocessing.pool import ThreadPool
+from multiprocessing.sharedctypes import RawArray
+
+from numpy import array, zeros, frombuffer, dtype
+
+from operators import SortPop, TournamentSelect
+from heap      import IndexedHeap
+
+def EvalOne(oFcn, i, c):
+    """
+    EvalOne evaluates one individual without raising Exceptions (runs on workers)
+    Output:
+      i   -- the given tag
+      c   -- the given chromosome
+      y   -- objective value or None if errors happened
+      err -- an error message or '' if no errors happened
+    """
+    try:
+        return i, c, oFcn(c), ''
+    except:
+        return i, c, None, 'ERROR: ' + traceback.format_exc().splitlines()[-1]
+
+
+def EvolveAsync(C, xFcn, oFcn, cxFcn, muFcn, nevals=100, nworkers=4, pool=None, trnK=2,
+        verb=False):
+    """
+    EvolveAsync solves minimisation problems with a steady-state genetic algorithm whose
+    objective values are computed asynchronously
+    Input:
+      C        -- all chromosomes == population
+      xFcn     -- 'display' function x(c)
+      oFcn     -- objective function y(c)
+      cxFcn    -- crossover function cx(c)
+      muFcn    -- mutation function mu(c)
+      nevals   -- total number of evaluations (budget), including the initial population
+      nworkers -- maximum number of concurrent evaluations
+      pool     -- [optional] pool with apply_async, e.g. multiprocessing.Pool (oFcn must then
+                  be picklable); default: a ThreadPool with nworkers threads
+      trnK     -- tournament size for selection of parents
+      verb     -- verbose
+    Output:
+      C  -- new population (sorted with best first)
+      Y  -- new objective values (sorted with best first)
+      OV -- best objective values after the initial population and after each new result
+    Note:
+      a new offspring is submitted as soon as any evaluation finishes and each result is
+      inserted on arrival by replacing the worst individual if it is better than it
+      (see EvolveSS); only the initial population is waited for as a whole
+    """
+
+    # convert C from list to array
+    if isinstance(C, list):
+        if isinstance(C[0], int): C = array(C, dtype=int)
+        else: C = array(C, dtype=float)
+
+    # auxiliary variables
+    ninds = len(C)
+    if nevals < ninds: raise Exception('nevals must be greater than or equal to ninds')
+    C = C.copy()
+    Y = zeros(ninds)
+    F, heap, ibest = None, None, 0
+    OV = []
+
+    # pool and queue with finished evaluations
+    own = pool == None
+    if own: pool = ThreadPool(nworkers)
+    done = Queue.Queue()
+
+    try:
+        todo = [(i, c) for i, c in enumerate(C)] # tag i >= 0: initial individual; -1: offspring
+        nsub, ndone, ninit, inflight = 0, 0, 0, 0
+        while ndone < nevals:
+
+            # submit evaluations
+            while inflight < nworkers and nsub < nevals:
+                if len(todo) == 0:
+                    if heap == None: break # wait for initial population
+                    S = TournamentSelect(F, 2, trnK)
+                    a, b = cxFcn(C[S[0]], C[S[1]])
+                    todo = [(-1, muFcn(a)), (-1, muFcn(b))]
+                i, c = todo.pop(0)
+                pool.apply_async(EvalOne, (oFcn, i, c), callback=done.put)
+                inflight += 1
+                nsub += 1
+
+            # collect one result
+            i, c, y, err = done.get()
+            inflight -= 1
+            ndone += 1
+            if err != '': raise Exception(err)
+
+            # initial population
+            if i >= 0:
+                Y[i] = y
+                ninit += 1
+                if ninit == ninds:
+                    F = -Y
+                    heap = IndexedHeap(Y)
+                    ibest = Y.argmin()
+                    OV.append(Y[ibest])
+                continue
+
+            # replace worst individual
+            iworst = heap.Top()
+            if y < heap.Key(iworst):
+                C[iworst], Y[iworst], F[iworst] = c, y, -y
+                heap.Update(iworst, y)
+                if y < Y[ibest]: ibest = iworst
+            OV.append(Y[ibest])
+            if verb: print 'evaluation = %d, best = %g' % (ndone, Y[ibest])
+
+    finally:
+        if own:
+            pool.terminate()
+            pool.join()
+
+    # results
+    C, Y, F = SortPop(C, Y, -Y)
+    return C, Y, array(OV)
+
+
+# buffers of pool workers (see SharedEvaluator)
+SHARED = {}
+
+def SharedInit(oFcn, rawC, rawY, nbases, dt, batch):
+    """
+    SharedInit sets the views of shared buffers on each worker process
+    """
+    SHARED['oFcn']  = oFcn
+    SHARED['C']     = frombuffer(rawC, dtype=dt).reshape(-1, nbases)
+    SHARED['Y']     = frombuffer(rawY, dtype=float)
+    SHARED['batch'] = batch
+
+
+def SharedEval(ab):
+    """
+    SharedEval evaluates C[a:b] and writes into Y[a:b] in place (runs on workers)
+    Output:
+      err -- an error message or '' if no errors happened
+    """
+    a, b = ab
+    oFcn, C, Y = SHARED['oFcn'], SHARED['C'], SHARED['Y']
+    try:
+        if SHARED['batch']: Y[a:b] = oFcn(C[a:b])
+        else:
+            for i in range(a, b): Y[i] = oFcn(C[i])
+    except:
+        return 'ERROR: ' + traceback.format_exc().splitlines()[-1]
+    return ''
+
+
+class SharedEvaluator(object):
+    """
+    SharedEvaluator evaluates populations on a process pool with shared memory buffers
+    Input:
+      oFcn      -- objective function y(c) or Y(C) if batch
+      ninds     -- maximum number of individuals in one call to Evaluate
+      nbases    -- number of bases of chromosomes
+      nproc     -- number of processes; None means the number of cores
+      dt        -- type of bases; e.g. float or int
+      batch     -- oFcn takes a matrix with chromosomes (rows) and returns all objective values
+      chunksize -- number of individuals evaluated in one task; None: ninds/nproc
+    Note:
+      the population C and the objective values Y are allocated in shared memory before
+      the worker processes are started; thus chromosomes are not pickled: only index
+      ranges (a, b) are sent to workers, which read C[a:b] and write Y[a:b] in place.
+      Evaluate can be given to Evolve as oFcn with batch=True. Call Close() at the end
+      or use the 'with' statement, which also closes the pool if errors happen
+    """
+
+    def __init__(self, oFcn, ninds, nbases, nproc=None, dt=float, batch=False, chunksize=None):
+        dt = dtype(dt)
+        self.ninds     = ninds
+        self.rawC      = RawArray('b', ninds * nbases * dt.itemsize)
+        self.rawY      = RawArray('b', ninds * dtype(float).itemsize)
+        self.C         = frombuffer(self.rawC, dtype=dt).reshape(ninds, nbases)
+        self.Y         = frombuffer(self.rawY, dtype=float)
+        self.pool      = Pool(nproc, SharedInit, (oFcn, self.rawC, self.rawY, nbases, dt, batch))
+        self.chunksize = chunksize
+        if nproc == None: nproc = cpu_count()
+        if chunksize == None: self.chunksize = max(1, (ninds - 1) / nproc + 1)
+
+    def Evaluate(self, C):
+        """
+        Evaluate computes the objective values of all chromosomes (rows of C)
+        """
+        n = len(C)
+        if n > self.ninds: raise Exception('number of individuals must not exceed %d' % self.ninds)
+        self.C[:n] = C
+        ranges = [(a, min(a + self.chunksize, n)) for a in range(0, n, self.chunksize)]
+        for err in self.pool.map(SharedEval, ranges):
+            if err != '': raise Exception(err)
+        return self.Y[:n].copy()
+
+    def Close(self):
+        """
+        Close stops the worker processes and releases the buffers
+        """
+        if self.pool == None: return
+        self.pool.terminate()
+        self.pool.join()
+        self.pool = None
+        self.C, self.Y, self.rawC, self.rawY = None, None, None, None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.Close()
@@ -0,0 +1,183 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from numpy import array, zeros, arange, hstack, cumsum, bincount, floor
+
+# Note: matplotlib is only imported when a plotting function is first called, so
+# importing this module (or output/solver) is cheap for runs that never draw
+
+
+def Gll(xl, yl, withleg=True, legpos=None):
+    """
+    Gll adds grid, labels and legend
+    """
+    from pylab import grid, xlabel, ylabel, legend
+    grid()
+    xlabel(xl)
+    ylabel(yl)
+    if withleg: legend(loc=legpos)
+
+
+def RectVerts(x0, w, y0, h):
+    """
+    RectVerts computes the vertices of many rectangles at once
+    Input:
+      x0 -- left coordinates (array)
+      w  -- widths (array)
+      y0 -- bottom coordinate
+      h  -- height
+    Output:
+      V -- vertices of rectangles: n x 4 x 2 array (for PolyCollection)
+    """
+    n = len(x0)
+    V = zeros((n, 4, 2))
+    V[:,0,0], V[:,1,0] = x0, x0 + w
+    V[:,2,0], V[:,3,0] = x0 + w, x0
+    V[:,:2,1], V[:,2:,1] = y0, y0 + h
+    return V
+
+
+def PlotProbBins(X, P, maxlabels=50, maxbins=500):
+    """
+    PlotProbBins plots probabilities bins
+     X         -- population
+     P         -- probabilities
+     maxlabels -- maximum number of labels/ticks; only bins wider than 1/maxlabels are labelled
+     maxbins   -- if there are more individuals than this, consecutive bins narrower than
+                  1/maxbins are merged into (grey) bins about 1/maxbins wide
+    """
+    from pylab import gca, xticks, text, axis, xlabel, grid, rcParams
+    from matplotlib.collections import PolyCollection
+    rcParams.update({'figure.figsize':[800/72.27,200/72.27]})
+    X, P = array(X), array(P, dtype=float)
+    Tk = hstack([[0.0], cumsum(P)])
+    x0, w = Tk[:-1], P
+    if len(P) > maxbins:
+        small = P < 1.0 / float(maxbins)
+        cell = floor(x0 * maxbins)              # small bins in the same cell are merged
+        prev = hstack([[False], small[:-1]])
+        keep = ~small | ~prev | (cell != hstack([[-1], cell[:-1]]))
+        grp = cumsum(keep) - 1                  # index of merged bin
+        x0 = x0[keep]
+        w = bincount(grp, weights=P)
+        X = X[keep]
+        nmerged = bincount(grp)
+        small = nmerged > 1
+    else:
+        small = zeros(len(P), dtype=bool)
+    fc = array(['#d5e7ed'] * len(w), dtype=object)
+    fc[small] = '#eeeeee'
+    gca().add_collection(PolyCollection(RectVerts(x0, w, 0.0, 0.2), facecolors=list(fc),
+        edgecolors='black', linewidths=0.2 if len(w) > maxlabels else 1.0, clip_on=0))
+    for i in (w >= 1.0 / float(maxlabels)).nonzero()[0]:
+        ha = 'center'
+        if i==len(w)-1: ha = 'left' # last one
+        if small[i]: lbl = '(%d)' % nmerged[i]
+        else:        lbl = '%.1f' % X[i]
+        text(x0[i]+w[i]/2.0, 0.1, lbl, ha=ha)
+    if len(Tk) <= maxlabels: xticks(Tk, ['%.2f'%v for v in Tk])
+    axis('equal')
+    gca().get_yaxis().set_visible(False)
+    for dir in ['left', 'right', 'top']:
+        gca().spines[dir].set_visible(False)
+    xlabel('cumulated probability')
+    grid()
+    axis([0, 1, 0, 0.2])
+
+
+def DrawChromo(key, A, pos, y0, swap_colors, red='#e3a9a9', blue='#c8d0e3', maxlabels=40):
+    """
+    DrawChromo draws one chromosome
+     maxlabels -- values of bases are only shown if nbases <= maxlabels
+    """
+    from pylab import gca, text
+    from matplotlib.collections import PolyCollection
+    nbases = len(A)
+    x0, l = 0.1, 1.0 / float(nbases)
+    red, blue = red, blue
+    text(x0-0.01, y0+0.05, key, ha='right')
+    if swap_colors: red, blue = blue, red
+    X = x0 + l * arange(nbases)
+    fc = [red] * pos + [blue] * (nbases - pos)
+    lw = 1.0
+    if nbases > maxlabels: lw = 0.0 # edges would hide the colours
+    gca().add_collection(PolyCollection(RectVerts(X, l, y0, 0.1), facecolors=fc,
+        edgecolors='black', linewidths=lw))
+    if nbases <= maxlabels:
+        for i in range(nbases):
+            text(X[i]+l/2.0, y0+0.05, '%.3f'%A[i], ha='center')
+
+
+def DrawCrossover(A, B, a, b, pos, maxlabels=40):
+    """
+    DrawCrossover draws crossover process
+    """
+    from pylab import gca, axis, rcParams
+    from matplotlib.patches import FancyArrowPatch
+    rcParams.update({'figure.figsize':[800/72.27,400/72.27]})
+    DrawChromo('A', A, pos, 0.35, 0, maxlabels=maxlabels)
+    DrawChromo('B', B, pos, 0.25, 1, maxlabels=maxlabels)
+    DrawChromo('a', a, pos, 0.10, 0, blue='#e3a9a9', maxlabels=maxlabels)
+    DrawChromo('b', b, pos, 0.00, 0, red='#c8d0e3', maxlabels=maxlabels)
+    axis('equal')
+    axis([0, 1.2, 0, 0.4])
+    gca().get_yaxis().set_visible(False)
+    gca().get_xaxis().set_visible(False)
+    for dir in ['left', 'right', 'top', 'bottom']:
+        gca().spines[dir].set_visible(False)
+    gca().add_patch(FancyArrowPatch([0.6,0.25], [0.6, 0.2], fc='#9fffde', mutation_scale=30))
+
+
+def SetForPng(proport=0.75, fig_width_pt=455.24, dpi=150, xylabel_fontsize=9,
+        leg_fontsize=8, text_fontsize=9, xtick_fontsize=7, ytick_fontsize=7):
+    """
+    Set figure proportions
+    ======================
+    """
+    from pylab import close as MPLclose
+    from pylab import rcParams, rcdefaults
+    inches_per_pt = 1.0/72.27                   # Convert pt to inch
+    fig_width     = fig_width_pt*inches_per_pt  # width in inches
+    fig_height    = fig_width*proport           # height in inches
+    fig_size      = [fig_width,fig_height]
+    params = {
+        'axes.labelsize'  : xylabel_fontsize,
+        'font.size'       : text_fontsize,
+        'legend.fontsize' : leg_fontsize,
+        'xtick.labelsize' : xtick_fontsize,
+        'ytick.labelsize' : ytick_fontsize,
+        'figure.figsize'  : fig_size,
+        'savefig.dpi'     : dpi,
+    }
+    MPLclose()
+    rcdefaults()
+    rcParams.update(params)
+
+
+def Save(filename, ea=None, verbose=True):
+    """
+    Save fig with extra artists
+    ===========================
+    INPUT:
+        ea : extra artists to adjust figure size.
+             it can be a list or a matplotlib object
+    Note:
+        As a workaround, savefig can take bbox_extra_artists keyword (this may
+        only be in the svn version though), which is a list artist that needs
+        to be accounted for the bounding box calculation. So in your case, the
+        below code will work.
+        t1 = ax.text(-0.2,0.5,'text',transform=ax.transAxes)
+        fig.savefig('test.png', bbox_inches='tight', bbox_extra_artists=[t1])
+    """
+    from pylab import savefig
+    if ea==None:
+        ea = []
+    else:
+        if not isinstance(ea, list):
+            ea = [ea]
+    ea = [x for x in ea if x is not None]
+    savefig (filename, bbox_inches='tight', bbox_extra_artists=ea)
+    if verbose:
+        print('File <[1;34m%s[0m> written'%filename)
+
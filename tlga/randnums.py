@@ -3,7 +3,7 @@
 # license that can be found in the LICENSE file.
 
 from numpy import ones
-from numpy.random import seed, random, randint, shuffle
+from numpy.random import seed, random, randint, shuffle, binomial
 
 def Seed(val):
     """
@@ -28,6 +28,13 @@ def FltRand(n, xa=0.0, xb=1.0):
     return res
 
 
+def FltRandArray(shape, xa=0.0, xb=1.0):
+    """
+    FltRandArray generates an array with given shape of numbers between xa and xb
+    """
+    return random(shape) * (xb - xa) + xa
+
+
 def FlipCoin(p):
     """
     Flip generates a Bernoulli variable; throw a coin with probability p
@@ -38,6 +45,20 @@ def FlipCoin(p):
     return False
 
 
+def NumFlips(n, p):
+    """
+    NumFlips generates the number of successes in n Bernoulli trials with probability p
+    """
+    return binomial(n, p)
+
+
+def Permutations(m, n):
+    """
+    Permutations generates m random permutations of 0..n-1 (one per row)
+    """
+    return random((m, n)).argsort(axis=1)
+
+
 def Shuffle(x):
     """
     Shuffle modifies an array by shuffling its contents
@@ -0,0 +1,197 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import socket, select, struct, traceback
+from multiprocessing import Process, Queue
+
+from numpy import array, zeros, frombuffer, ascontiguousarray, dtype
+
+# Protocol (all integers are little-endian):
+#   request: '<4sII' header with dtype (e.g. '<f8'), nrows, ncols; then the raw array
+#            data; nrows == 0 asks the worker to close the connection
+#   reply:   '<I' header with nrows followed by nrows float64 objective values; or
+#            ERRFLAG followed by '<I' length and the error message
+HEADER  = struct.Struct('<4sII')
+COUNT   = struct.Struct('<I')
+ERRFLAG = 0xFFFFFFFF
+
+def RecvAll(sock, n):
+    """
+    RecvAll receives exactly n bytes from socket or raises socket.error
+    """
+    buf = bytearray(n)
+    view = memoryview(buf)
+    k = 0
+    while k < n:
+        m = sock.recv_into(view[k:], n - k)
+        if m == 0: raise socket.error('connection closed')
+        k += m
+    return buf
+
+
+def SendArray(sock, C):
+    """
+    SendArray sends a matrix with chromosomes (rows) as raw data
+    """
+    C = ascontiguousarray(C)
+    sock.sendall(HEADER.pack(C.dtype.str.ljust(4), C.shape[0], C.shape[1]) + C.tobytes())
+
+
+def RecvArray(sock):
+    """
+    RecvArray receives a matrix sent by SendArray
+    Output:
+      C -- matrix or None if the 'close' message was received
+    """
+    dt, nrows, ncols = HEADER.unpack(str(RecvAll(sock, HEADER.size)))
+    if nrows == 0: return None
+    dt = dtype(dt.strip())
+    buf = RecvAll(sock, nrows * ncols * dt.itemsize)
+    return frombuffer(buf, dtype=dt).reshape(nrows, ncols)
+
+
+def RunWorker(oFcn, port=0, host='localhost', batch=False, portq=None):
+    """
+    RunWorker runs a worker that evaluates chromosomes sent by a Coordinator; it never returns
+    Input:
+      oFcn  -- objective function y(c) or Y(C) if batch
+      port  -- port to listen to; use 0 for any free port
+      host  -- host name or address to listen to; e.g. '' for all interfaces
+      batch -- oFcn takes a matrix with chromosomes (rows) and returns all objective values
+      portq -- [optional] queue where the port number is put after binding
+    Note:
+      one coordinator is served at a time; errors in oFcn are sent back to the coordinator
+    """
+    srv = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    srv.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    srv.bind((host, port))
+    srv.listen(1)
+    if portq != None: portq.put(srv.getsockname()[1])
+    while True:
+        conn, addr = srv.accept()
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        try:
+            while True:
+                C = RecvArray(conn)
+                if C is None: break
+                try:
+                    if batch: Y = array(oFcn(C), dtype=float)
+                    else:     Y = array([oFcn(c) for c in C], dtype=float)
+                except:
+                    msg = 'ERROR: ' + traceback.format_exc().splitlines()[-1]
+                    conn.sendall(COUNT.pack(ERRFLAG) + COUNT.pack(len(msg)) + msg)
+                    continue
+                conn.sendall(COUNT.pack(len(Y)) + Y.tobytes())
+        except socket.error:
+            pass
+        conn.close()
+
+
+def StartLocalWorkers(oFcn, nworkers, batch=False):
+    """
+    StartLocalWorkers starts worker processes listening on localhost
+    Output:
+      procs -- list of processes (call terminate() to stop them)
+      addrs -- list of (host, port) to be given to Coordinator
+    """
+    portq = Queue()
+    procs = []
+    for i in range(nworkers):
+        p = Process(target=RunWorker, args=(oFcn, 0, 'localhost', batch, portq))
+        p.daemon = True
+        p.start()
+        procs.append(p)
+    addrs = [('localhost', portq.get()) for p in procs]
+    return procs, addrs
+
+
+class Coordinator(object):
+    """
+    Coordinator dispatches batches of chromosomes to remote workers (see RunWorker)
+    Input:
+      addrs     -- list of (host, port) of workers
+      chunksize -- maximum number of chromosomes sent at once to one worker;
+                   None means that the population is divided among the live workers
+      timeout   -- timeout in seconds for connecting and receiving results; None: wait forever
+    Note:
+      connections are kept open across calls to Evaluate; a worker that disconnects (or
+      times out) is dropped and its chunk is sent again to another worker
+      Evaluate can be given to Evolve as oFcn with batch=True
+    """
+
+    def __init__(self, addrs, chunksize=None, timeout=None):
+        self.chunksize = chunksize
+        self.timeout   = timeout
+        self.socks     = []
+        for addr in addrs:
+            sock = socket.create_connection(addr, timeout)
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            self.socks.append(sock)
+
+    def Evaluate(self, C):
+        """
+        Evaluate computes the objective values of all chromosomes (rows of C)
+        """
+        C = array(C)
+        nrows = len(C)
+        Y = zeros(nrows)
+        size = self.chunksize
+        if size == None: size = max(1, (nrows - 1) / max(1, len(self.socks)) + 1)
+        todo = [(a, min(a + size, nrows)) for a in range(0, nrows, size)]
+        busy = {} # socket => chunk
+        err = ''  # error message from workers
+        while len(todo) > 0 or len(busy) > 0:
+
+            # send chunks to idle workers
+            for sock in self.socks[:]:
+                if len(todo) == 0 or err != '': break
+                if sock in busy: continue
+                a, b = todo.pop()
+                try:
+                    SendArray(sock, C[a:b])
+                    busy[sock] = (a, b)
+                except socket.error:
+                    self.Drop(sock)
+                    todo.append((a, b))
+            if len(self.socks) == 0: raise Exception('all workers are disconnected')
+
+            # receive results
+            ready, w, x = select.select(busy.keys(), [], [], self.timeout)
+            if len(ready) == 0: # timeout: drop all busy workers
+                for sock in busy.keys():
+                    todo.append(busy.pop(sock))
+                    self.Drop(sock)
+            for sock in ready:
+                a, b = busy.pop(sock)
+                try:
+                    n, = COUNT.unpack(str(RecvAll(sock, COUNT.size)))
+                    if n == ERRFLAG:
+                        m, = COUNT.unpack(str(RecvAll(sock, COUNT.size)))
+                        err = str(RecvAll(sock, m))
+                        continue
+                    Y[a:b] = frombuffer(RecvAll(sock, n * 8), dtype=float)
+                except socket.error:
+                    self.Drop(sock)
+                    todo.append((a, b))
+            if err != '' and len(busy) == 0: raise Exception(err)
+        return Y
+
+    def Drop(self, sock):
+        """
+        Drop closes the connection to one worker
+        """
+        sock.close()
+        self.socks.remove(sock)
+
+    def Close(self):
+        """
+        Close asks workers to close the connections
+        """
+        for sock in self.socks:
+            try:
+                sock.sendall(HEADER.pack('<f8 ', 0, 0))
+            except socket.error:
+                pass
+            sock.close()
+        self.socks = []
@@ -2,31 +2,169 @@
 # Use of this source code is governed by a BSD-style
 # license that can be found in the LICENSE file.
 
-from numpy import array, cumsum, zeros
+from numpy import array, cumsum, zeros, arange, lexsort, vstack, sqrt, maximum, isnan
 
+from randnums  import IntRand
 from operators import Fitness, SortPop, Ranking, RouletteSelect, SUSselect, FilterPairs
+from operators import TournamentSelect
+from operators import NonDominatedSort, CrowdingDistance, Duplicates
+from output    import PrintPop
+from heap      import IndexedHeap
+
+def EvalPop(C, oFcn, dup=None, cache=None, batch=False, store=None):
+    """
+    EvalPop computes the objective values of all individuals
+    Input:
+      C     -- chromosomes/population
+      oFcn  -- objective function y(c) or Y(C) if batch
+      dup   -- how to handle duplicated chromosomes:
+                 None   : evaluate every individual
+                 'copy' : evaluate each distinct chromosome once and copy its objective value
+                 newFcn : function c_new = newFcn(c) replacing duplicates (e.g. by mutated or
+                          fresh individuals); remaining duplicates (after 3 trials) are copied
+      cache -- [optional] dictionary mapping chromosome bytes to known objective values
+               (e.g. from the previous generation); not used if dup == None and store == None
+      batch -- oFcn takes a matrix with chromosomes (rows) and returns all objective values
+      store -- [optional] persistent archive with Get(C) and Put(C, Y); e.g. EvalStore.
+               It is consulted before calling oFcn; distinct chromosomes are evaluated once
+    Output:
+      C    -- chromosomes (with duplicates replaced if dup is a function)
+      Y    -- objective values
+      info -- dictionary with 'dup': ratio of duplicates, 'neval': number of evaluations
+              and 'nstore': number of values found in store (as available)
+    """
+    if dup == None and store == None:
+        if batch: return C, array(oFcn(C), dtype=float), {}
+        return C, array([oFcn(c) for c in C]), {}
+    info = {}
+    if dup != None:
+        D = Duplicates(C)
+        info['dup'] = D.sum() / float(len(C))
+        if dup != 'copy':
+            C = C.copy()
+            for trial in range(3):
+                if not D.any(): break
+                for i in D.nonzero()[0]: C[i] = dup(C[i].copy())
+                D = Duplicates(C)
+    if cache == None: cache = {}
+    keys = [c.tobytes() for c in C]
+    new, newkeys = [], set() # individuals to be evaluated
+    for i, key in enumerate(keys):
+        if not key in cache and not key in newkeys:
+            new.append(i)
+            newkeys.add(key)
+    if store != None:
+        info['nstore'] = 0
+        if len(new) > 0:
+            for i, y in zip(new, store.Get(C[new])):
+                if isnan(y): continue
+                cache[keys[i]] = y
+                info['nstore'] += 1
+            new = [i for i in new if not keys[i] in cache]
+    if len(new) > 0:
+        if batch: Ynew = oFcn(C[new])
+        else:     Ynew = [oFcn(C[i]) for i in new]
+        for i, y in zip(new, Ynew): cache[keys[i]] = y
+        if store != None: store.Put(C[new], Ynew)
+    Y = array([cache[key] for key in keys], dtype=float)
+    info['neval'] = len(new)
+    return C, Y, info
+
+
+def ConsPop(C, cons, repair=None):
+    """
+    ConsPop computes the violations of (cheap) constraints of all individuals
+    Input:
+      C      -- chromosomes/population
+      cons   -- list of functions v = g(C) returning the violation of each chromosome (rows
+                of C), which is zero (or negative) if the constraint is satisfied; the
+                functions are called in sequence and each one only with the chromosomes
+                satisfying all the previous ones (cascade); thus cheaper ones should come first
+      repair -- [optional] function C_new = repair(C) repairing infeasible chromosomes (rows);
+                the repaired ones are checked again
+    Output:
+      C -- chromosomes (with infeasible ones repaired)
+      V -- violations: zero for feasible chromosomes
+    """
+    C = array(C)
+    V = zeros(len(C))
+    I = arange(len(C)) # feasible so far
+    for g in cons:
+        if len(I) == 0: break
+        V[I] = maximum(g(C[I]), 0.0)
+        I = I[V[I] == 0]
+    if repair != None and len(I) < len(C):
+        J = (V > 0).nonzero()[0]
+        C = C.copy()
+        C[J], V[J] = ConsPop(repair(C[J]), cons)
+    return C, V
+
 
 def Evolve(C, xFcn, oFcn, cxFcn, muFcn, ngen=10, elite=True, sus=False, rnk=False, rnkSP=1.2,
-        verb=False, showC=False):
+        verb=False, showC=False, hist=None, dup=None, trn=False, trnK=2, trnRep=True,
+        batch=False, surr=None, surrFrac=0.5, store=None, vec=False, adapt=None,
+        dFcn=None, cons=None, repair=None):
     """
     Evolve solves minimisation problems with a simple genetic algorithm
     Input:
-      C     -- all chromosomes == population
-      xFcn  -- 'display' function x(c)
-      oFcn  -- objective function y(c)
-      cxFcn -- crossover function cx(c)
-      muFcn -- mutation function mu(c)
-      ngen  -- number of generations
-      elite -- use elitism
-      verb  -- verbose
-      showC -- also show chromosomes if verbose
-      sus   -- use Stochastic Universal Sampling selection instead of Roulette Wheel
-      rnk   -- use ranking
-      rnkSP -- ranking selective pressure
+      C        -- all chromosomes == population
+      xFcn     -- 'display' function x(c)
+      oFcn     -- objective function y(c); if it is a method of an object with cacheable ==
+                  False (e.g. MultiFidelity.Evaluate), whose values depend on the other
+                  individuals of the same call, dup, store and surr cannot be used
+      cxFcn    -- crossover function cx(c)
+      muFcn    -- mutation function mu(c)
+      ngen     -- number of generations
+      elite    -- use elitism
+      verb     -- verbose
+      showC    -- also show chromosomes if verbose
+      sus      -- use Stochastic Universal Sampling selection instead of Roulette Wheel
+      rnk      -- use ranking
+      rnkSP    -- ranking selective pressure
+      hist     -- history sink with Append(gen, C, Y, info) and Flush() methods; e.g. HistWriter
+      dup      -- handling of duplicated chromosomes (see EvalPop); e.g. 'copy'
+      trn      -- use tournament selection; the population is then only sorted at the end
+                  and ranking is not used
+      trnK     -- tournament size
+      trnRep   -- tournament with replacement
+      batch    -- oFcn takes a matrix with chromosomes (rows) and returns all objective values
+      surr     -- [optional] surrogate model with Add(C, Y) and Predict(C); e.g. KnnSurrogate
+      surrFrac -- fraction of offspring, with the best predictions, evaluated with oFcn;
+                  the others keep their predicted values but are never ranked above
+                  the worst evaluated offspring
+      store    -- [optional] persistent archive of objective values; e.g. EvalStore
+      vec      -- crossover and mutation functions work on many chromosomes at once:
+                  a, b = cx(A, B) takes npairs x nbases matrices with all parents and
+                  mu(C) takes the matrix with all offspring; e.g. SBXCrossover and PolyMutation
+      adapt    -- [optional] function pc, pm = adapt(gen, C, Y) computing the rates for the
+                  next generation; e.g. AdaptiveRates. Then the crossover and mutation
+                  functions are called as cx(A, B, pc=pc) and mu(c, pm=pm)
+      dFcn     -- [optional] delta objective function y = d(c, cp, yp, rec) computing the
+                  objective value of an offspring c which is only a mutation of its parent
+                  cp (with objective value yp); rec has the changes reported by the mutation
+                  function (e.g. 'pos' of FltMutation or 'cut1', 'cut2', 'ins' of OrdMutation)
+                  and d may return None to request the full evaluation. The crossover and
+                  mutation functions are then called as cx(A, B, rec=rx) and mu(c, rec=rec)
+                  and must report changes (see FltCrossover and OrdCrossover: 'cx')
+      cons     -- [optional] list of cheap vectorised constraints v = g(C) (see ConsPop)
+                  checked before oFcn; infeasible individuals are not given to oFcn and
+                  get the largest objective value of feasible individuals found so far
+                  plus their violation; thus they are always ranked below feasible ones
+                  (the best individual is penalised again before elitism). dup can
+                  only be None or 'copy' and surr cannot be used
+      repair   -- [optional] function C_new = repair(C) for infeasible chromosomes (rows)
+                  applied before the penalty (see ConsPop)
     Output:
       C  -- new population (sorted with best first)
       Y  -- new objective values (sorted with best first)
       OV -- best objective values during all generations
+    Note:
+      with surr, the root-mean-square error of predictions of evaluated offspring is
+      given to hist as 'serr' and the number of evaluations as 'neval'; with adapt,
+      the rates are given to hist as 'pc' and 'pm'; with dFcn, the number of offspring
+      computed by d is given to hist as 'ndelta' and dup and store only apply to the
+      other offspring; with cons, the number of infeasible individuals (not evaluated)
+      is given to hist as 'nskip'
     """
 
     # convert C from list to array
@@ -37,25 +175,62 @@ def Evolve(C, xFcn, oFcn, cxFcn, muFcn, ngen=10, elite=True, sus=False, rnk=Fals
     # objective values
     ninds = len(C)
     nbases = len(C[0])
-    Y = array([oFcn(c) for c in C]) # objective values
+    if cons != None and dup != None and dup != 'copy':
+        raise Exception('cons cannot be used with a dup function (replacements are not checked)')
+    if cons != None and surr != None:
+        raise Exception('cons cannot be used with surr (penalties are not objective values)')
+    if not getattr(getattr(oFcn, '__self__', None), 'cacheable', True):
+        if dup != None or store != None or surr != None:
+            raise Exception('dup, store and surr cannot be used with this oFcn (e.g. MultiFidelity)')
+    if cons == None:
+        C, Y, info = EvalPop(C, oFcn, dup, None, batch, store) # objective values
+    else:
+        C, V = ConsPop(C, cons, repair)
+        feas = V == 0
+        Y, info = zeros(ninds), {}
+        if feas.any(): C[feas], Y[feas], info = EvalPop(C[feas], oFcn, dup, None, batch, store)
+        ymax = Y[feas].max() if feas.any() else 0.0 # largest feasible objective value
+        Y[~feas] = ymax + V[~feas]
+        info.setdefault('neval', feas.sum())
+        info['nskip'] = ninds - feas.sum()
+    if surr != None:
+        surr.Add(C, Y)
+        info.setdefault('neval', ninds)
+        info['serr'] = float('nan')
+        pkeys = set() # keys of chromosomes with predicted objective values
+    if dFcn != None:
+        if vec or surr != None or cons != None:
+            raise Exception('dFcn cannot be used with vec, surr or cons')
+        info.setdefault('neval', ninds)
+        info['ndelta'] = 0
 
     # fitness and probabilities (sorted)
     F = Fitness(Y)
-    C, Y, F = SortPop(C, Y, F)
-    if rnk: F = Ranking(ninds, rnkSP)
-    P = F / sum(F)
-    M = cumsum(P)
+    if not trn:
+        C, Y, F = SortPop(C, Y, F)
+        if rnk: F = Ranking(ninds, rnkSP)
+        P = F / sum(F)
+        M = cumsum(P)
+
+    # rates of crossover and mutation
+    cxArgs, muArgs = {}, {}
+    if adapt != None:
+        cxArgs['pc'], muArgs['pm'] = adapt(0, C, Y)
+        info.update(cxArgs, **muArgs)
 
     # results
     OV = zeros(ngen+1)
-    OV[0] = Y[0] # best first objective value
+    OV[0] = Y.min() # best first objective value
+    if hist != None: hist.Append(0, C, Y, info)
 
     # evolution
     for gen in range(ngen):
 
         # best individual
-        bestC = C[0].copy()
-        bestY = Y[0]
+        ibest = 0
+        if trn: ibest = Y.argmin()
+        bestC = C[ibest].copy()
+        bestY = Y[ibest]
 
         # print generation
         if verb:
@@ -63,51 +238,267 @@ def Evolve(C, xFcn, oFcn, cxFcn, muFcn, ngen=10, elite=True, sus=False, rnk=Fals
             PrintPop(C, Y, xFcn, F, showC=showC)
 
         # selection
-        if sus: S = SUSselect(M, ninds)
-        else:   S = RouletteSelect(M, ninds)
+        if   trn: S = TournamentSelect(F, ninds, trnK, trnRep)
+        elif sus: S = SUSselect(M, ninds)
+        else:     S = RouletteSelect(M, ninds)
         idxA, idxB = FilterPairs(S)
 
         # reproduction
-        Cnew = [] # new chromosomes
-        for k in range(ninds/2):
+        if vec:
+            a, b = cxFcn(C[idxA], C[idxB], **cxArgs)
+            Cnew = zeros((2*len(a), nbases), dtype=a.dtype)
+            Cnew[0::2], Cnew[1::2] = a, b
+            Cnew = muFcn(Cnew, **muArgs)
+        else:
+            Cnew = [] # new chromosomes
+            Pnew = [] # parents of offspring which are only mutated (or -1) and changes
+            for k in range(ninds/2):
 
-            # parents
-            A, B = C[idxA[k]], C[idxB[k]]
+                # parents
+                A, B = C[idxA[k]], C[idxB[k]]
 
-            # crossover
-            a, b = cxFcn(A, B)
+                # crossover
+                rx, ra, rb = {}, {}, {} # records of changes
+                if dFcn == None: a, b = cxFcn(A, B, **cxArgs)
+                else:            a, b = cxFcn(A, B, rec=rx, **cxArgs)
 
-            # mutation
-            a = muFcn(a)
-            b = muFcn(b)
+                # mutation
+                if dFcn == None:
+                    a = muFcn(a, **muArgs)
+                    b = muFcn(b, **muArgs)
+                else:
+                    a = muFcn(a, rec=ra, **muArgs)
+                    b = muFcn(b, rec=rb, **muArgs)
+                    if rx.get('cx', True): Pnew.extend([(-1, None), (-1, None)])
+                    else:                  Pnew.extend([(idxA[k], ra), (idxB[k], rb)])
 
-            # new individuals
-            Cnew.append(a)
-            Cnew.append(b)
+                # new individuals
+                Cnew.append(a)
+                Cnew.append(b)
 
         # new population
-        C = array(Cnew)
-        Y = array([oFcn(c) for c in C]) # objective values
+        cache = None
+        if dup != None:
+            cache = dict([(c.tobytes(), y) for c, y in zip(C, Y)])
+            if surr != None:
+                for key in pkeys: cache.pop(key, None)
+        Cnew = array(Cnew)
+        if cons != None:
+            Cnew, V = ConsPop(Cnew, cons, repair)
+            feas = V == 0
+            Call, Cnew = Cnew, Cnew[feas]
+        if len(Cnew) == 0: # all offspring are infeasible
+            C, Y, info = Cnew, zeros(0), {}
+        elif surr == None and dFcn == None:
+            C, Y, info = EvalPop(Cnew, oFcn, dup, cache, batch, store) # objective values
+        elif dFcn != None:
+            Ynew = zeros(len(Cnew))
+            I = [] # offspring requiring the full evaluation
+            for i, (p, rec) in enumerate(Pnew):
+                y = None
+                if p >= 0: y = dFcn(Cnew[i], C[p], Y[p], rec)
+                if y == None: I.append(i)
+                else: Ynew[i] = y
+            info = {}
+            if len(I) > 0: Cnew[I], Ynew[I], info = EvalPop(Cnew[I], oFcn, dup, cache, batch, store)
+            info.setdefault('neval', len(I))
+            info['ndelta'] = len(Cnew) - len(I)
+            C, Y = Cnew, Ynew
+        else:
+            C = Cnew
+            Y = surr.Predict(C)
+            O = Y.argsort()
+            I = O[:max(1, int(surrFrac * ninds))] # most promising offspring
+            J = O[len(I):]
+            C[I], Ytrue, info = EvalPop(C[I], oFcn, dup, cache, batch, store)
+            info.setdefault('neval', len(I))
+            info['serr'] = sqrt(((Y[I] - Ytrue)**2.0).mean())
+            surr.Add(C[I], Ytrue)
+            Y[I] = Ytrue
+            Y[J] = maximum(Y[J], Ytrue.max())
+            pkeys = set([c.tobytes() for c in C[J]])
+        if cons != None:
+            Call[feas] = C
+            Yall = zeros(len(Call))
+            Yall[feas] = Y
+            if feas.any(): ymax = max(ymax, Y.max())
+            Yall[~feas] = ymax + V[~feas]
+            C, Y = Call, Yall
+            info.setdefault('neval', feas.sum())
+            info['nskip'] = len(C) - feas.sum()
         F = Fitness(Y)
 
         # elitism
         if elite:
-            I = F.argsort()[::-1] # the [::-1] is a trick to reverse the sorting order
-            best  = I[0]
-            worst = I[ninds-1]
+            if trn:
+                best, worst = F.argmax(), F.argmin()
+            else:
+                I = F.argsort()[::-1] # the [::-1] is a trick to reverse the sorting order
+                best  = I[0]
+                worst = I[ninds-1]
+            if cons != None: # penalty of best individual with the current ymax
+                v = ConsPop(bestC[None,:], cons)[1][0]
+                if v > 0: bestY = ymax + v
             if bestY < Y[best] and bestY < Y[worst]:
                 C[worst] = bestC
                 Y[worst] = bestY
                 F = Fitness(Y)
 
         # probabilities (sorted)
-        C, Y, F = SortPop(C, Y, F)
-        if rnk: F = Ranking(ninds, rnkSP)
-        P = F / sum(F)
-        M = cumsum(P)
+        if not trn:
+            C, Y, F = SortPop(C, Y, F)
+            if rnk: F = Ranking(ninds, rnkSP)
+            P = F / sum(F)
+            M = cumsum(P)
+
+        # rates of crossover and mutation
+        if adapt != None:
+            cxArgs['pc'], muArgs['pm'] = adapt(gen+1, C, Y)
+            info.update(cxArgs, **muArgs)
 
         # objective values
-        OV[gen+1] = Y[0] # best current objective value
+        OV[gen+1] = Y.min() # best current objective value
+        if hist != None: hist.Append(gen+1, C, Y, info)
 
     # results
+    if trn: C, Y, F = SortPop(C, Y, F)
+    if hist != None: hist.Flush()
     return C, Y, OV
+
+
+def EvolveSS(C, xFcn, oFcn, cxFcn, muFcn, nsteps=100, nbatch=2, trnK=2, verb=False, hist=None):
+    """
+    EvolveSS solves minimisation problems with a steady-state genetic algorithm
+    Input:
+      C      -- all chromosomes == population
+      xFcn   -- 'display' function x(c)
+      oFcn   -- objective function y(c)
+      cxFcn  -- crossover function cx(c)
+      muFcn  -- mutation function mu(c)
+      nsteps -- number of steps
+      nbatch -- number of offspring produced and evaluated at each step (even number)
+      trnK   -- tournament size for selection of parents
+      verb   -- verbose
+      hist   -- history sink with Append(gen, C, Y, info) and Flush() methods; called every step
+    Output:
+      C  -- new population (sorted with best first)
+      Y  -- new objective values (sorted with best first)
+      OV -- best objective values during all steps
+    Note:
+      each offspring replaces the current worst individual if it is better than it;
+      the worst individual is found with an indexed heap, so each insertion costs
+      O(log n) and neither the fitness nor the probabilities are rebuilt
+    """
+
+    # convert C from list to array
+    if isinstance(C, list):
+        if isinstance(C[0], int): C = array(C, dtype=int)
+        else: C = array(C, dtype=float)
+
+    # objective values
+    C = C.copy()
+    Y = array([oFcn(c) for c in C], dtype=float)
+    F = -Y # fitness for tournaments: updated in place
+    heap = IndexedHeap(Y)
+    ibest = Y.argmin()
+
+    # results
+    OV = zeros(nsteps+1)
+    OV[0] = Y[ibest]
+    if hist != None: hist.Append(0, C, Y, {})
+
+    # evolution
+    for step in range(nsteps):
+
+        # selection and reproduction
+        S = TournamentSelect(F, nbatch, trnK)
+        idxA, idxB = FilterPairs(S)
+        Cnew = []
+        for k in range(len(idxA)):
+            a, b = cxFcn(C[idxA[k]], C[idxB[k]])
+            Cnew.append(muFcn(a))
+            Cnew.append(muFcn(b))
+        Ynew = [oFcn(c) for c in Cnew]
+
+        # replace worst individuals
+        for c, y in zip(Cnew, Ynew):
+            iworst = heap.Top()
+            if y < heap.Key(iworst):
+                C[iworst], Y[iworst], F[iworst] = c, y, -y
+                heap.Update(iworst, y)
+                if y < Y[ibest]: ibest = iworst
+
+        # results
+        OV[step+1] = Y[ibest]
+        if hist != None: hist.Append(step+1, C, Y, {})
+        if verb: print 'step = %d, best = %g' % (step, Y[ibest])
+
+    # results
+    C, Y, F = SortPop(C, Y, F)
+    if hist != None: hist.Flush()
+    return C, Y, OV
+
+
+def EvolveMO(C, oFcn, cxFcn, muFcn, ngen=10, verb=False):
+    """
+    EvolveMO solves multi-objective minimisation problems with a NSGA-II-like algorithm
+    Input:
+      C     -- all chromosomes == population
+      oFcn  -- objective function Y(C): takes the whole population and returns
+               a ninds x nobj array with all objective values
+      cxFcn -- crossover function cx(c)
+      muFcn -- mutation function mu(c)
+      ngen  -- number of generations
+      verb  -- verbose
+    Output:
+      C  -- new population (sorted by front and then by decreasing crowding distance)
+      Y  -- new objective values (sorted as C)
+      Cp -- chromosomes in the Pareto front
+      Yp -- objective values of the Pareto front
+    """
+
+    # convert C from list to array
+    if isinstance(C, list):
+        if isinstance(C[0], int): C = array(C, dtype=int)
+        else: C = array(C, dtype=float)
+
+    # objective values, fronts and crowding distances
+    ninds = len(C)
+    Y = array(oFcn(C), dtype=float)
+    R = NonDominatedSort(Y)
+    D = CrowdingDistance(Y, R)
+
+    # evolution
+    for gen in range(ngen):
+
+        # print generation
+        if verb: print 'gen = %d, size of Pareto front = %d' % (gen, sum(R == 0))
+
+        # selection: binary tournament on (rank, crowding distance)
+        pos = zeros(ninds, dtype=int)
+        pos[lexsort((-D, R))] = arange(ninds) # position in crowded order: smaller is better
+        T = IntRand(0, ninds, (ninds, 2))
+        S = T[arange(ninds), pos[T].argmin(axis=1)]
+        idxA, idxB = FilterPairs(S)
+
+        # reproduction
+        Cnew = [] # new chromosomes
+        for k in range(ninds/2):
+            a, b = cxFcn(C[idxA[k]], C[idxB[k]])
+            Cnew.append(muFcn(a))
+            Cnew.append(muFcn(b))
+        Cnew = array(Cnew)
+        Ynew = array(oFcn(Cnew), dtype=float)
+
+        # survivors from parents + offspring
+        C = vstack([C, Cnew])
+        Y = vstack([Y, Ynew])
+        R = NonDominatedSort(Y)
+        D = CrowdingDistance(Y, R)
+        I = lexsort((-D, R))[:ninds]
+        C, Y, R, D = C[I], Y[I], R[I], D[I]
+
+    # results
+    I = lexsort((-D, R))
+    C, Y, R = C[I], Y[I], R[I]
+    return C, Y, C[R == 0], Y[R == 0]
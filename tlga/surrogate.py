@@ -0,0 +1,54 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from numpy import array, zeros, arange, sqrt, maximum
+
+class KnnSurrogate(object):
+    """
+    KnnSurrogate predicts objective values from an archive of evaluated chromosomes by
+    inverse-distance weighting of the k nearest neighbours
+    Input:
+      k       -- number of neighbours
+      maxsize -- maximum number of (chromosome, y) pairs in the archive; when full, the
+                 oldest pairs are overwritten. Thus there is no fitting stage and the cost
+                 of Predict is bounded by O(n * maxsize * nbases)
+    """
+
+    def __init__(self, k=5, maxsize=1000):
+        self.k       = k
+        self.maxsize = maxsize
+        self.X       = None # archive of chromosomes
+        self.Y       = None # archive of objective values
+        self.size    = 0    # number of pairs in archive
+        self.next    = 0    # position of next pair in archive (ring buffer)
+
+    def Add(self, C, Y):
+        """
+        Add stores evaluated chromosomes in the archive
+         C -- chromosomes
+         Y -- objective values
+        """
+        C, Y = array(C, dtype=float), array(Y, dtype=float)
+        if self.X is None:
+            self.X = zeros((self.maxsize, C.shape[1]))
+            self.Y = zeros(self.maxsize)
+        n = min(len(C), self.maxsize)
+        I = (self.next + arange(n)) % self.maxsize
+        self.X[I], self.Y[I] = C[-n:], Y[-n:]
+        self.next = (self.next + n) % self.maxsize
+        self.size = min(self.size + n, self.maxsize)
+
+    def Predict(self, C):
+        """
+        Predict estimates the objective values of chromosomes
+        """
+        C = array(C, dtype=float)
+        X, Y = self.X[:self.size], self.Y[:self.size]
+        D2 = (C**2.0).sum(axis=1)[:,None] + (X**2.0).sum(axis=1)[None,:] - 2.0 * C.dot(X.T)
+        D = sqrt(maximum(D2, 0.0))
+        k = min(self.k, self.size)
+        J = D.argpartition(k-1, axis=1)[:,:k] # k nearest neighbours
+        I = arange(len(C))[:,None]
+        W = 1.0 / maximum(D[I,J], 1e-12)
+        return (W * Y[J]).sum(axis=1) / W.sum(axis=1)
@@ -0,0 +1,84 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import inspect, itertools
+from multiprocessing import Pool
+
+from numpy import array
+
+from randnums import Seed
+from solver   import Evolve
+
+# arguments of Evolve that can be set in a sweep
+EVOLVEKEYS = inspect.getargspec(Evolve).args[6:]
+
+def SweepGrid(seeds, **prms):
+    """
+    SweepGrid generates all combinations of seeds and parameters
+    Input:
+      seeds -- list of seeds
+      prms  -- lists of values of parameters; e.g. pc=[0.6, 0.8], elite=[True, False]
+    Output:
+      P -- list of dictionaries with 'seed' and one value of each parameter
+    """
+    keys = sorted(prms.keys())
+    P = []
+    for vals in itertools.product(*[prms[key] for key in keys]):
+        for seed in seeds:
+            prm = dict(zip(keys, vals))
+            prm['seed'] = seed
+            P.append(prm)
+    return P
+
+
+def SweepRun(args):
+    """
+    SweepRun runs one case of a sweep (runs on workers)
+    """
+    setup, ngen, prm = args
+    Seed(prm['seed'])
+    C, xFcn, oFcn, cxFcn, muFcn = setup(prm)
+    kwargs = dict([(key, val) for key, val in prm.items() if key in EVOLVEKEYS])
+    C, Y, OV = Evolve(C, xFcn, oFcn, cxFcn, muFcn, ngen, **kwargs)
+    return OV
+
+
+def Sweep(setup, prms, ngen=10, nproc=None):
+    """
+    Sweep runs Evolve for many seeds and settings on a process pool
+    Input:
+      setup -- function C, xFcn, oFcn, cxFcn, muFcn = setup(prm) creating the initial
+               population and the functions of one run (e.g. cxFcn using prm['pc']);
+               it must be defined at module level, so it can be sent to workers
+      prms  -- list of dictionaries with 'seed' and parameters of each run (see SweepGrid);
+               values of keys that are arguments of Evolve (elite, sus, rnk, rnkSP, trn, ...)
+               are given to Evolve
+      ngen  -- number of generations
+      nproc -- number of processes; None means the number of cores; 1: run serially
+    Output:
+      OV  -- best objective values of all runs: nruns x (ngen+1) array
+      res -- summary with one dictionary per setting (prm without seed) and the
+             keys 'nruns', 'mean', 'std', 'min', 'max' of the final best objective values
+    """
+    args = [(setup, ngen, prm) for prm in prms]
+    if nproc == 1:
+        OV = array([SweepRun(a) for a in args])
+    else:
+        pool = Pool(nproc)
+        try:
+            OV = array(pool.map(SweepRun, args))
+        finally:
+            pool.terminate()
+            pool.join()
+    groups = {}
+    for i, prm in enumerate(prms):
+        key = tuple(sorted([(k, v) for k, v in prm.items() if k != 'seed']))
+        groups.setdefault(key, []).append(OV[i,-1])
+    res = []
+    for key in sorted(groups.keys()):
+        vals = array(groups[key])
+        r = dict(key)
+        r.update(nruns=len(vals), mean=vals.mean(), std=vals.std(), min=vals.min(), max=vals.max())
+        res.append(r)
+    return OV, res
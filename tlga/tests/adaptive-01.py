@@ -0,0 +1,80 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from numpy import pi, sin, array, sqrt, roll, minimum
+
+from tlga.randnums  import Seed, FltRand, FltRandArray
+from tlga.operators import SimpleChromo, FltCrossover, FltMutation
+from tlga.operators import OrdChromoPop, OrdCrossover, OrdMutation
+from tlga.adaptive  import FltDiversity, OrdEdges, OrdDiversity, AdaptiveRates
+from tlga.solver    import Evolve
+from tlga.history   import HistMemory
+from tlga.testing   import CheckVector
+
+# initialise random numbers generator
+Seed(1234)
+
+# diversity measures ----------------------------------------------------------------------
+print 'diversity measures --------------------------------------------------------------------'
+
+C = array([[1.0, 2.0], [3.0, 2.0]])
+CheckVector('FltDiversity', '0.5', FltDiversity(C), 0.5)
+CheckVector('FltDiversity(same)', '0', FltDiversity([[1.0, 2.0], [1.0, 2.0]]), 0.0)
+
+C = array([[0,1,2,3], [0,2,1,3]])
+E = OrdEdges(C)
+print 'E =\n', E
+Ecor = [[0,1,1,2],
+        [0,0,2,1],
+        [0,0,0,1],
+        [0,0,0,0]]
+CheckVector('E', 'Ecor', E, Ecor)
+CheckVector('OrdDiversity', '1-12/16', OrdDiversity(C), 1.0 - 12.0/16.0)
+CheckVector('OrdDiversity(same)', '0', OrdDiversity([[0,1,2,3], [2,1,0,3]]), 0.0)
+
+# sin function ----------------------------------------------------------------------------
+print '\nsin function --------------------------------------------------------------------------'
+
+def oFcn(c): return -sum(c) * sin(sum(c))
+def xFcn(c): return str(sum(c))
+
+ninds, nbases, ngen = 20, 5, 30
+C = [SimpleChromo(x, nbases) for x in FltRand(ninds, 0.0, 4.0*pi)]
+adapt = AdaptiveRates(FltDiversity, pc=(0.6, 0.9), pm=(0.01, 0.3), every=2)
+hist = HistMemory()
+C, Y, OV = Evolve(C, xFcn, oFcn, FltCrossover, FltMutation, ngen, hist=hist, adapt=adapt)
+print 'pc =', array(adapt.PC)
+print 'pm =', array(adapt.PM)
+print 'best: x =', xFcn(C[0]), ' y =', Y[0]
+CheckVector('len(PC)', 'len(OV)', len(adapt.PC), len(OV))
+CheckVector('pc(hist)', 'PC', hist.Get('pc'), adapt.PC)
+CheckVector('pm(hist)', 'PM', hist.Get('pm'), adapt.PM)
+CheckVector('pc[0], pm[0]', '0.9, 0.01', abs(array([adapt.PC[0], adapt.PM[0]]) - [0.9, 0.01]) < 1e-12, True)
+CheckVector('pc[1] == pc[0]', 'True', adapt.PC[1] == adapt.PC[0], True)
+R = array(adapt.R)
+CheckVector('pc', 'pcmin+(pcmax-pcmin)*r', abs(array(adapt.PC) - (0.6 + 0.3*R)) < 1e-12, True)
+CheckVector('pm', 'pmmax-(pmmax-pmmin)*r', abs(array(adapt.PM) - (0.3 - 0.29*R)) < 1e-12, True)
+D = hist.Get('div')[::2] # rates are updated every 2 generations
+CheckVector('r', 'min(div/div0, 1)', abs(R[::2] - minimum(D / D[0], 1.0)) < 1e-12, True)
+
+# travelling salesman ---------------------------------------------------------------------
+print '\ntravelling salesman -------------------------------------------------------------------'
+
+ncities = 15
+X = FltRandArray((ncities, 2))
+def oFcn(c):
+    D = X[c] - X[roll(c, -1)]
+    return sqrt((D**2.0).sum(axis=1)).sum()
+def xFcn(c): return str(c)
+
+ninds, ngen = 30, 40
+C = OrdChromoPop(ninds, ncities)
+adapt = AdaptiveRates(OrdDiversity)
+C, Y, OV = Evolve(C, xFcn, oFcn, OrdCrossover, OrdMutation, ngen, adapt=adapt)
+print 'relative diversity =', array(adapt.R)
+print 'pm =', array(adapt.PM)
+print 'best length =', Y[0]
+CheckVector('diversity decreases', 'True', adapt.R[-1] < 0.9, True)
+CheckVector('pm increases', 'True', adapt.PM[-1] > adapt.PM[0], True)
+CheckVector('OV non-increasing', 'True', (OV[1:] <= OV[:-1]).all(), True)
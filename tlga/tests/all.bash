@@ -3,3 +3,24 @@
 python order-cross-01.py
 python order-mut-01.py
 python sin-function-01.py
+python history-01.py
+python plot-01.py
+python import-time-01.py
+python multi-obj-01.py
+python duplicates-01.py
+python tournament-01.py
+python steady-state-01.py
+python async-01.py
+python remote-01.py
+python surrogate-01.py
+python evalstore-01.py
+python sharedmem-01.py
+python sweep-01.py
+python init-pop-01.py
+python real-coded-01.py
+python adaptive-01.py
+python delta-01.py
+python order-cross-02.py
+python constraints-01.py
+python multi-fidelity-01.py
+python bin-coded-01.py
@@ -0,0 +1,58 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import time
+
+from numpy import pi, sin
+
+from tlga.randnums  import Seed, FltRand
+from tlga.operators import SimpleChromo, FltCrossover, FltMutation
+from tlga.parallel  import EvolveAsync
+from tlga.testing   import CheckVector
+
+# initialise random numbers generator
+Seed(1234)
+
+# objective function with uneven cost: sleeps up to 20 ms ---------------------------------
+print 'uneven costs --------------------------------------------------------------------------'
+
+tsleep = [0.0]
+def oFcn(c):
+    x = sum(c)
+    dt = 0.002 + 0.018 * abs(sin(7.0 * x))
+    tsleep[0] += dt
+    time.sleep(dt)
+    return -x * sin(x)
+
+ninds, nbases, nevals = 20, 5, 200
+def xFcn(c):     return str(sum(c))
+def cxFcn(A, B): return FltCrossover(A, B, 0.8)
+def muFcn(c):    return FltMutation(c, 0.01)
+
+C = [SimpleChromo(x, nbases) for x in FltRand(ninds, 0.0, 4.0*pi)]
+t0 = time.time()
+C, Y, OV = EvolveAsync(C, xFcn, oFcn, cxFcn, muFcn, nevals, nworkers=8)
+dt = time.time() - t0
+print 'total sleep time = %g, wall time = %g' % (tsleep[0], dt)
+print 'best: x =', xFcn(C[0]), ' y =', Y[0]
+CheckVector('len(OV)', 'nevals-ninds+1', len(OV), nevals-ninds+1)
+CheckVector('OV non-increasing', 'True', (OV[1:] <= OV[:-1]).all(), True)
+CheckVector('Y[0]', 'OV[-1]', Y[0], OV[-1])
+CheckVector('Y', 'oFcn(C)', Y, [-sum(c) * sin(sum(c)) for c in C])
+CheckVector('wall time < sleep time / 4', 'True', dt < tsleep[0] / 4.0, True)
+
+# errors in objective function ------------------------------------------------------------
+print '\nerrors ----------------------------------------------------------------------------------'
+
+def badFcn(c):
+    if sum(c) > 6.0: raise Exception('cannot compute')
+    return sum(c)
+
+try:
+    EvolveAsync(C, xFcn, badFcn, cxFcn, muFcn, nevals, nworkers=4)
+    msg = ''
+except Exception as e:
+    msg = str(e)
+print 'msg =', msg
+CheckVector('msg', 'ERROR: ...', msg, 'ERROR: Exception: cannot compute')
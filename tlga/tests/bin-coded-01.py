@@ -0,0 +1,101 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from numpy import array, zeros, ones
+
+from tlga.randnums  import Seed, FltRandArray
+from tlga.operators import BinChromoPop, BinPack, BinUnpack, BinCrossover, BinMutation
+from tlga.solver    import Evolve
+from tlga.testing   import CheckVector
+
+# initialise random numbers generator
+Seed(1234)
+
+# packing ---------------------------------------------------------------------------------
+print 'packing ---------------------------------------------------------------------------------'
+
+b = array([[1,0,1,1,0,0,0,1, 1,1,0]])
+c = BinPack(b)
+print 'c =', c
+CheckVector('c', 'c_sol', c, [[177, 192]])
+CheckVector('unpack', 'b', BinUnpack(c, 11), b)
+
+C = BinChromoPop(1000, 256)
+print 'memory: packed = %d bytes, float64 = %d bytes' % (C.nbytes, 1000*256*8)
+CheckVector('shape', '1000 x 32', C.shape, (1000, 32))
+CheckVector('ratio of ones', '~0.5', abs(BinUnpack(C, 256).mean() - 0.5) < 0.01, True)
+
+# crossover -------------------------------------------------------------------------------
+print '\ncrossover -------------------------------------------------------------------------------'
+
+nbits = 21
+A, B = BinChromoPop(500, nbits), BinChromoPop(500, nbits)
+UA, UB = BinUnpack(A, nbits), BinUnpack(B, nbits)
+a, b = BinCrossover(A, B, nbits, 1.0, '1P', cut=10)
+Ua, Ub = BinUnpack(a, nbits), BinUnpack(b, nbits)
+CheckVector('1P: a[:10]', 'A[:10]', Ua[:,:10], UA[:,:10])
+CheckVector('1P: a[10:]', 'B[10:]', Ua[:,10:], UB[:,10:])
+CheckVector('1P: b[:10]', 'B[:10]', Ub[:,:10], UB[:,:10])
+CheckVector('1P: b[10:]', 'A[10:]', Ub[:,10:], UA[:,10:])
+
+a, b = BinCrossover(A, B, nbits, 1.0, '1P')
+Ua, Ub = BinUnpack(a, nbits), BinUnpack(b, nbits)
+ok = True
+for k in range(len(A)):
+    d = (Ua[k] != UA[k]).nonzero()[0] # a[k] differs from A[k] only after the cut
+    ok = ok and (len(d) == 0 or (Ua[k,d[0]:] == UB[k,d[0]:]).all())
+CheckVector('1P: one cut', 'True', ok, True)
+CheckVector('1P: a+b', 'A+B', Ua + Ub, UA + UB)
+
+a, b = BinCrossover(A, B, nbits, 1.0, 'UX')
+Ua, Ub = BinUnpack(a, nbits), BinUnpack(b, nbits)
+CheckVector('UX: a+b', 'A+B', Ua + Ub, UA + UB)
+CheckVector('UX: mixed', 'True', ((Ua != UA) & (UA != UB)).any(), True)
+CheckVector('padding', '0', BinUnpack(a, 24)[:,nbits:], zeros((500, 3)))
+
+a, b = BinCrossover(A, B, nbits, 0.0, 'UX')
+CheckVector('pc=0', 'parents', [a, b], [A, B])
+
+# mutation --------------------------------------------------------------------------------
+print '\nmutation --------------------------------------------------------------------------------'
+
+C = BinChromoPop(1000, nbits)
+M = BinMutation(C, nbits, 0.05)
+nflips = (BinUnpack(M, 24) != BinUnpack(C, 24)).sum()
+print 'flipped bits =', nflips, 'of', 1000*nbits
+CheckVector('ratio of flips', '~0.05', abs(nflips / (1000.0*nbits) - 0.05) < 0.005, True)
+CheckVector('padding', '0', BinUnpack(M, 24)[:,nbits:], zeros((1000, 3)))
+CheckVector('single chromosome', 'shape', BinMutation(C[0], nbits, 0.5).shape, C[0].shape)
+
+C = BinChromoPop(2000, 64)
+for pm in [0.2, 0.5, 0.8]:
+    M = BinMutation(C, 64, pm)
+    rate = (BinUnpack(M, 64) != BinUnpack(C, 64)).mean()
+    print 'pm = %g: ratio of flipped bits = %g' % (pm, rate)
+    CheckVector('ratio of flips', 'pm', abs(rate - pm) < 0.01, True)
+M = BinMutation(BinChromoPop(1000, nbits), nbits, 0.9)
+CheckVector('padding (pm=0.9)', '0', BinUnpack(M, 24)[:,nbits:], zeros((1000, 3)))
+
+# knapsack --------------------------------------------------------------------------------
+print '\nknapsack --------------------------------------------------------------------------------'
+
+nitems = 100
+W = FltRandArray(nitems, 1.0, 10.0) # weights
+V = W + FltRandArray(nitems, 0.0, 5.0) # values
+cap = 0.3 * W.sum()
+def oFcn(C): return -BinUnpack(C, nitems).dot(V)
+def gcap(C): return BinUnpack(C, nitems).dot(W) - cap
+def xFcn(c): return str(BinUnpack(c, nitems))
+def cxFcn(A, B): return BinCrossover(A, B, nitems, 0.9, 'UX')
+def muFcn(C):    return BinMutation(C, nitems, 1.0/nitems)
+
+ninds, ngen = 40, 100
+C = BinPack(FltRandArray((ninds, nitems)) < 0.1)
+C, Y, OV = Evolve(C, xFcn, oFcn, cxFcn, muFcn, ngen, batch=True, vec=True, cons=[gcap])
+X = BinUnpack(C[0], nitems)
+print 'initial = %g, best = %g' % (OV[0], Y[0])
+print 'weight = %g, capacity = %g' % (X.dot(W), cap)
+CheckVector('dtype', 'uint8', C.dtype, 'uint8')
+CheckVector('feasible', 'True', X.dot(W) <= cap, True)
+CheckVector('improved', 'True', Y[0] < 1.5 * OV[0], True)
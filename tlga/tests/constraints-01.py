@@ -0,0 +1,115 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from numpy import pi, sin, array, maximum, clip
+
+from tlga.randnums  import Seed, FltRand
+from tlga.operators import SimpleChromo, FltCrossover, FltMutation
+from tlga.operators import RealChromoPop, SBXCrossover, PolyMutation
+from tlga.solver    import Evolve, ConsPop
+from tlga.history   import HistMemory
+from tlga.surrogate import KnnSurrogate
+from tlga.testing   import CheckVector
+
+# initialise random numbers generator
+Seed(1234)
+
+# cascade ---------------------------------------------------------------------------------
+print 'cascade ---------------------------------------------------------------------------------'
+
+nrows = []
+def g1(C): # x >= 0
+    nrows.append(len(C))
+    return -C[:,0]
+def g2(C): # x + y <= 1
+    nrows.append(len(C))
+    return C.sum(axis=1) - 1.0
+
+C = array([[0.5, 0.2], [-1.0, 0.0], [0.9, 0.9], [0.1, 0.1]])
+C, V = ConsPop(C, [g1, g2])
+print 'V =', V
+CheckVector('V', 'Vcor', V, [0.0, 1.0, 0.8, 0.0])
+CheckVector('rows given to g1, g2', '4, 3', nrows, [4, 3])
+
+def repair(C): return C / maximum(C.sum(axis=1), 1.0)[:,None]
+C = array([[0.5, 0.2], [-1.0, 0.0], [0.9, 0.9], [0.1, 0.1]])
+C, V = ConsPop(C, [g1, g2], repair)
+print 'C =\n', C
+CheckVector('V (repair)', 'Vcor', V, [0.0, 1.0, 0.0, 0.0])
+CheckVector('C[2] (repair)', '0.5, 0.5', C[2], [0.5, 0.5])
+
+# sin function ----------------------------------------------------------------------------
+print '\nsin function --------------------------------------------------------------------------'
+
+ncalls = [0]
+def oFcn(c):
+    ncalls[0] += 1
+    x = sum(c)
+    if x < xmin or x > xmax: raise Exception('infeasible individual was evaluated')
+    return -x * sin(x)
+
+xmin, xmax = 0.0, 4.0*pi
+def gmin(C): return xmin - C.sum(axis=1)
+def gmax(C): return C.sum(axis=1) - xmax
+def xFcn(c): return str(sum(c))
+def cxFcn(A, B): return FltCrossover(A, B, 0.8)
+def muFcn(c):    return FltMutation(c, 0.3)
+
+ninds, nbases, ngen = 20, 5, 30
+C = [SimpleChromo(x, nbases) for x in FltRand(ninds, xmin, xmax)]
+hist = HistMemory()
+C, Y, OV = Evolve(C, xFcn, oFcn, cxFcn, muFcn, ngen, hist=hist, cons=[gmin, gmax])
+X = C.sum(axis=1)
+print 'nskip =', hist.Get('nskip')
+print 'best: x =', X[0], ' y =', Y[0]
+CheckVector('ncalls', 'sum(neval)', ncalls[0], hist.Get('neval').sum())
+CheckVector('ncalls + nskip', 'ninds*(ngen+1)', ncalls[0] + hist.Get('nskip').sum(), ninds*(ngen+1))
+CheckVector('some skipped', 'True', hist.Get('nskip').sum() > 0, True)
+feas = (X >= xmin) & (X <= xmax)
+CheckVector('feasible first', 'True', feas[:feas.sum()].all(), True)
+CheckVector('Y[0]', 'oFcn(C[0])', Y[0], -X[0] * sin(X[0]))
+
+print '\nwith repair:'
+def repair(C): return C * (clip(C.sum(axis=1), xmin, xmax - 1e-9) / C.sum(axis=1))[:,None]
+ncalls[0] = 0
+C = [SimpleChromo(x, nbases) for x in FltRand(ninds, xmin, xmax)]
+hist = HistMemory()
+C, Y, OV = Evolve(C, xFcn, oFcn, cxFcn, muFcn, ngen, hist=hist, cons=[gmin, gmax], repair=repair)
+print 'best: x =', sum(C[0]), ' y =', Y[0]
+CheckVector('nskip (repair)', '0', hist.Get('nskip'), 0)
+CheckVector('ncalls', 'ninds*(ngen+1)', ncalls[0], ninds*(ngen+1))
+
+# infeasible initial population -----------------------------------------------------------
+print '\ninfeasible initial population -------------------------------------------------------'
+
+def oFcn(C): return 100.0 + C[:,0]
+def gx(C): return C[:,0] - 1.0 # x <= 1
+def cxFcn(A, B): return SBXCrossover(A, B, 0.0, 5.0, 0.9)
+def muFcn(C):    return PolyMutation(C, 0.0, 5.0, 1.0)
+C = RealChromoPop(20, [2.0], [5.0])
+hist = HistMemory()
+C, Y, OV = Evolve(C, xFcn, oFcn, cxFcn, muFcn, 30, hist=hist, batch=True, vec=True, cons=[gx])
+V = ConsPop(C, [gx])[1]
+print 'nskip =', hist.Get('nskip')
+print 'best: x =', C[0][0], ' y =', Y[0]
+CheckVector('nskip[0]', '20', hist.Get('nskip')[0], 20)
+CheckVector('best is feasible', 'True', V[0] == 0, True)
+CheckVector('feasible first', 'True', (V[:(V == 0).sum()] == 0).all(), True)
+CheckVector('OV[-1] ~ 100', 'True', abs(OV[-1] - 100.0) < 0.01, True)
+
+# duplicates replaced by function are not checked
+try:
+    Evolve(C, xFcn, oFcn, cxFcn, muFcn, 1, batch=True, vec=True, cons=[gx], dup=muFcn)
+    raised = False
+except Exception:
+    raised = True
+CheckVector('cons with dup function', 'Exception', raised, True)
+
+# penalties must not be given to surrogates
+try:
+    Evolve(C, xFcn, oFcn, cxFcn, muFcn, 1, batch=True, vec=True, cons=[gx], surr=KnnSurrogate())
+    raised = False
+except Exception:
+    raised = True
+CheckVector('cons with surr', 'Exception', raised, True)
@@ -0,0 +1,91 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from numpy import array, sqrt, roll, arange
+
+from tlga.randnums  import Seed, FltRandArray
+from tlga.operators import FltCrossover, FltMutation
+from tlga.operators import OrdChromoPop, OrdCrossover, OrdMutation
+from tlga.solver    import Evolve
+from tlga.history   import HistMemory
+from tlga.testing   import CheckVector
+
+# initialise random numbers generator
+Seed(1234)
+
+# records of changes ----------------------------------------------------------------------
+print 'records of changes --------------------------------------------------------------------'
+
+rec = {}
+c = OrdMutation(array([1,2,3,4,5,6,7,8]), pm=1, cut1=2, cut2=5, ins=3, rec=rec)
+print 'rec =', rec
+CheckVector('c', 'c_sol', c, [1,2,6,7,3,4,5,8])
+CheckVector('rec', 'cuts', [rec['mu'], rec['cut1'], rec['cut2'], rec['ins']], [True, 2, 5, 3])
+
+rec = {}
+c = OrdMutation(array([1,2,3,4]), pm=0, rec=rec)
+CheckVector('rec (pm=0)', 'mu=False', rec, {'mu':False})
+
+rec = {}
+A, B = array([1,2,3,4]), array([4,3,2,1])
+a, b = OrdCrossover(A, B, pc=0, rec=rec)
+CheckVector('rec (pc=0)', 'cx=False', rec, {'cx':False})
+
+rec = {}
+c = array([1.0, 2.0, 3.0])
+c = FltMutation(c, pm=1, rec=rec)
+print 'rec =', rec
+CheckVector('changed position', 'pos', (c != [1.0, 2.0, 3.0]).nonzero()[0], rec['pos'])
+
+# travelling salesman ---------------------------------------------------------------------
+print '\ntravelling salesman -------------------------------------------------------------------'
+
+ncities = 40
+X = FltRandArray((ncities, 2))
+def Dist(i, j): return sqrt(((X[i] - X[j])**2.0).sum())
+
+ncalls = [0]
+def oFcn(c):
+    ncalls[0] += 1
+    D = X[c] - X[roll(c, -1)]
+    return sqrt((D**2.0).sum(axis=1)).sum()
+
+def dFcn(c, cp, yp, rec):
+    if not rec['mu']: return yp
+    n, i, j, ins = len(cp), rec['cut1'], rec['cut2'], rec['ins']
+    def V(k): # k-th item of parent without the cut subtour
+        k = k % (n - j + i)
+        if k < i: return cp[k]
+        return cp[k + j - i]
+    u0, u1 = cp[i], cp[j-1]
+    y = yp - Dist(cp[i-1], u0) - Dist(u1, cp[j % n]) + Dist(cp[i-1], cp[j % n])
+    return y - Dist(V(ins), V(ins+1)) + Dist(V(ins), u0) + Dist(u1, V(ins+1))
+
+c = arange(ncities)
+y = oFcn(c)
+ok = True
+for k in range(200):
+    rec = {}
+    m = OrdMutation(c, pm=1, rec=rec)
+    ok = ok and abs(dFcn(m, c, y, rec) - oFcn(m)) < 1e-10
+CheckVector('delta == full', 'True', ok, True)
+
+def xFcn(c): return str(c)
+def cxFcn(A, B, rec=None): return OrdCrossover(A, B, 0.5, rec=rec)
+def muFcn(c, rec=None):    return OrdMutation(c, 0.5, rec=rec)
+
+ninds, ngen = 40, 50
+ncalls[0] = 0
+C = OrdChromoPop(ninds, ncities)
+hist = HistMemory()
+C, Y, OV = Evolve(C, xFcn, oFcn, cxFcn, muFcn, ngen, hist=hist, dFcn=dFcn)
+nfull = ncalls[0]
+print 'ndelta =', hist.Get('ndelta')
+print 'full evaluations =', nfull, 'of', ninds*(ngen+1)
+print 'best length =', Y[0]
+CheckVector('ncalls', 'sum(neval)', nfull, hist.Get('neval').sum())
+CheckVector('ncalls + ndelta', 'ninds*(ngen+1)', nfull + hist.Get('ndelta').sum(), ninds*(ngen+1))
+CheckVector('some deltas', 'True', hist.Get('ndelta').sum() > ninds*ngen/4, True)
+CheckVector('Y', 'oFcn(C)', abs(Y - [oFcn(c) for c in C]) < 1e-10, True)
+CheckVector('OV non-increasing', 'True', (OV[1:] <= OV[:-1]).all(), True)
@@ -0,0 +1,72 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from numpy import array, sqrt, arange
+
+from tlga.randnums  import Seed, Shuffle
+from tlga.operators import Duplicates, OrdCrossover, OrdMutation
+from tlga.solver    import Evolve
+from tlga.history   import HistMemory
+from tlga.testing   import CheckVector
+
+# find duplicates -------------------------------------------------------------------------
+print 'find duplicates -----------------------------------------------------------------------'
+
+C = array([[1,2,3], [3,2,1], [1,2,3], [2,3,1], [3,2,1], [1,2,3]], dtype=int)
+D = Duplicates(C)
+print 'D =', D
+CheckVector('D', 'Dcor', D, [0, 0, 1, 0, 1, 1])
+
+# traveling salesman ----------------------------------------------------------------------
+print '\ntraveling salesman --------------------------------------------------------------------'
+
+# location / coordinates of cities
+L = array([[ 60, 200], [180, 200], [ 80, 180], [140, 180], [ 20, 160],
+           [100, 160], [200, 160], [140, 140], [ 40, 120], [100, 120],
+           [180, 100], [ 60,  80], [120,  80], [180,  60], [ 20,  40],
+           [100,  40], [200,  40], [ 20,  20], [ 60,  20], [160,  20]], dtype=float)
+
+# objective function: counts number of calls
+ncalls = [0]
+def oFcn(c):
+    ncalls[0] += 1
+    d = L[c] - L[c[range(1, len(c)) + [0]]]
+    return sqrt((d**2.0).sum(axis=1)).sum()
+
+# input data
+ninds = 50
+ngen  = 40
+def xFcn(c):     return '-'.join(['%d' % v for v in c])
+def cxFcn(A, B): return OrdCrossover(A, B, 0.8)
+def muFcn(c):    return OrdMutation(c, 0.01)
+def newFcn(c):   return OrdMutation(c, 1.0)
+
+# run with and without duplicates handling
+res = {}
+for dup in [None, 'copy', newFcn]:
+    Seed(1234)
+    C = []
+    for i in range(ninds):
+        I = range(len(L))
+        Shuffle(I)
+        C.append(I)
+    C = array(C, dtype=int)
+    ncalls[0] = 0
+    hist = HistMemory()
+    C, Y, OV = Evolve(C, xFcn, oFcn, cxFcn, muFcn, ngen, hist=hist, dup=dup)
+    res[dup] = OV, ncalls[0], hist
+    print 'dup = %-6s: ncalls = %4d, best = %g' % (str(dup)[:6], ncalls[0], OV[-1])
+
+# check
+OV0, n0, h0 = res[None]
+OV1, n1, h1 = res['copy']
+OV2, n2, h2 = res[newFcn]
+print 'duplicate ratio (copy) =', h1.Get('dup')
+print 'duplicate ratio (new)  =', h2.Get('dup')
+CheckVector('OV(copy)', 'OV(None)', OV1, OV0)
+CheckVector('ncalls(None)', 'ninds*(ngen+1)', n0, ninds*(ngen+1))
+CheckVector('ncalls(copy)', 'sum(neval)', n1, h1.Get('neval').sum())
+CheckVector('ncalls(copy) < ncalls(None)', 'True', n1 < n0, True)
+CheckVector('dup(copy) > 0', 'True', h1.Get('dup')[-1] > 0, True)
+CheckVector('ncalls(new)', 'sum(neval)', n2, h2.Get('neval').sum())
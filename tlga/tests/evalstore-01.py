@@ -0,0 +1,75 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import os
+from multiprocessing import Process
+
+from numpy import pi, sin, array, arange, isnan
+
+from tlga.randnums  import Seed, FltRand
+from tlga.operators import SimpleChromo, FltCrossover, FltMutation
+from tlga.solver    import Evolve
+from tlga.evalstore import EvalStore
+from tlga.testing   import CheckVector
+
+# database file
+fn = '/tmp/tlga-evalstore-01.db'
+if os.path.exists(fn): os.remove(fn)
+
+# eviction --------------------------------------------------------------------------------
+print 'eviction ------------------------------------------------------------------------------'
+
+store = EvalStore(fn, 'eviction', maxsize=10)
+C = arange(50, dtype=float).reshape(25, 2)
+for k in range(5): store.Put(C[5*k:5*k+5], C[5*k:5*k+5,0])
+Y = store.Get(C)
+print 'Y =', Y
+CheckVector('size', '10', store.Size(), 10)
+CheckVector('oldest are evicted', 'True', isnan(Y[:15]).all(), True)
+CheckVector('Y[15:]', 'C[15:,0]', Y[15:], C[15:,0])
+store.Close()
+
+# concurrent writers ----------------------------------------------------------------------
+print '\nconcurrent writers --------------------------------------------------------------------'
+
+def writer(k):
+    store = EvalStore(fn, 'concurrent')
+    for i in range(20):
+        c = array([[k, i]], dtype=float)
+        store.Put(c, [k * 100 + i])
+    store.Close()
+
+procs = [Process(target=writer, args=(k,)) for k in range(4)]
+for p in procs: p.start()
+for p in procs: p.join()
+store = EvalStore(fn, 'concurrent')
+C = array([[k, i] for k in range(4) for i in range(20)], dtype=float)
+CheckVector('Y', 'Ycor', store.Get(C), [k * 100 + i for k in range(4) for i in range(20)])
+store.Close()
+
+# reruns with different settings ----------------------------------------------------------
+print '\nreruns ----------------------------------------------------------------------------------'
+
+ncalls = [0]
+def oFcn(c):
+    ncalls[0] += 1
+    return -sum(c) * sin(sum(c))
+
+def xFcn(c): return str(sum(c))
+def muFcn(c): return FltMutation(c, 0.01)
+
+res = []
+for pc in [0.8, 0.6]:
+    def cxFcn(A, B): return FltCrossover(A, B, pc)
+    Seed(1234)
+    C = [SimpleChromo(x, 5) for x in FltRand(20, 0.0, 4.0*pi)]
+    ncalls[0] = 0
+    store = EvalStore(fn, 'sin-function')
+    C, Y, OV = Evolve(C, xFcn, oFcn, cxFcn, muFcn, 20, store=store)
+    res.append((ncalls[0], store.Size(), OV))
+    store.Close()
+    print 'pc = %g: ncalls = %d, size of store = %d' % (pc, ncalls[0], res[-1][1])
+CheckVector('ncalls (first run)', 'size of store', res[0][0], res[0][1])
+CheckVector('ncalls (second run) < ncalls (first run)', 'True', res[1][0] < res[0][0], True)
+CheckVector('Y[0]', 'oFcn(C[0])', Y[0], -sum(C[0]) * sin(sum(C[0])))
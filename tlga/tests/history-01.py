@@ -0,0 +1,68 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from numpy import pi, sin, array, isnan
+
+from tlga.randnums  import Seed, FltRand
+from tlga.operators import SimpleChromo, FltCrossover, FltMutation
+from tlga.solver    import Evolve
+from tlga.history   import HistMemory, HistWriter, ReadHist, HISTKEYS
+from tlga.testing   import CheckVector
+
+# input data
+ninds  = 10    # number of individuals: population size
+nbases = 5     # number of bases in chromosome
+ngen   = 20    # number of generations
+
+# objective function
+def oFcn(c):
+    x = sum(c)
+    return -x * sin(x)
+
+# crossover and mutation functions
+def xFcn(c):     return str(sum(c))
+def cxFcn(A, B): return FltCrossover(A, B, 0.8)
+def muFcn(c):    return FltMutation(c, 0.01)
+
+# run with all sinks
+for sink in ['mem', 'csv', 'bin']:
+
+    print '\n%s sink -------------------------------------------------------------------------' % sink
+
+    # population
+    Seed(1111)
+    C = [SimpleChromo(x, nbases) for x in FltRand(ninds, 0.0, 4.0*pi)]
+
+    # history
+    if sink == 'mem': hist = HistMemory()
+    else:             hist = HistWriter('/tmp/tlga-history-01', sink, bufsize=3)
+
+    # run GA
+    C, Y, OV = Evolve(C, xFcn, oFcn, cxFcn, muFcn, ngen, hist=hist)
+
+    # check
+    if sink == 'mem': res = hist.res
+    else:             res = ReadHist('/tmp/tlga-history-01', sink)
+    print 'OV   =', OV
+    print 'best =', res['best']
+    CheckVector('gen', '0..ngen', res['gen'], range(ngen+1))
+    CheckVector('best', 'OV', res['best'], OV)
+    CheckVector('best<=mean', 'True', res['best'] <= res['mean'], True)
+    CheckVector('mean<=worst', 'True', res['mean'] <= res['worst'], True)
+
+# missing keys: columns are fixed by the first record
+print '\nmissing keys --------------------------------------------------------------------------'
+for sink in ['mem', 'csv']:
+    if sink == 'mem': hist = HistMemory()
+    else:             hist = HistWriter('/tmp/tlga-history-01', sink)
+    for gen, info in enumerate([{'a':1, 'b':2}, {'a':3}, {'a':4, 'c':5}]):
+        hist.Append(gen, C, Y, info)
+    hist.Flush()
+    if sink == 'mem': res = hist.res
+    else:             res = ReadHist('/tmp/tlga-history-01', sink)
+    b = array(res['b'])
+    print '%s: b =' % sink, b
+    CheckVector('%s: keys' % sink, 'first record', sorted(res.keys()), sorted(HISTKEYS + ['a', 'b']))
+    CheckVector('%s: a' % sink, '1,3,4', res['a'], [1, 3, 4])
+    CheckVector('%s: b' % sink, '2,nan,nan', [b[0] == 2] + list(isnan(b[1:])), [True, True, True])
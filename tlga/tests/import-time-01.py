@@ -0,0 +1,41 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import sys, time
+
+# importing the solver and text output must not load matplotlib ---------------------------
+print 'import time ---------------------------------------------------------------------------'
+
+t0 = time.time()
+from tlga.solver import Evolve
+from tlga.output import PrintPop
+dt = time.time() - t0
+print 'time to import tlga.solver and tlga.output = %g s' % dt
+
+from tlga.testing import CheckVector
+CheckVector('matplotlib imported', 'False', 'matplotlib' in sys.modules, False)
+
+# verbose run: PrintPop with arrays of fitness --------------------------------------------
+print '\nverbose run ---------------------------------------------------------------------------'
+
+from numpy import pi, sin
+from tlga.randnums  import Seed, FltRand
+from tlga.operators import SimpleChromo, FltCrossover, FltMutation, Fitness
+Seed(1234)
+def oFcn(c): return -sum(c) * sin(sum(c))
+def xFcn(c): return str(sum(c))
+def cxFcn(A, B): return FltCrossover(A, B, 0.8)
+def muFcn(c):    return FltMutation(c, 0.01)
+C = [SimpleChromo(x, 3) for x in FltRand(6, 0.0, 4.0*pi)]
+C, Y, OV = Evolve(C, xFcn, oFcn, cxFcn, muFcn, 2, verb=True, showC=True)
+F = Fitness(Y)
+PrintPop(C, Y, xFcn, F, F/F.sum(), (F/F.sum()).cumsum())
+CheckVector('matplotlib imported (verb)', 'False', 'matplotlib' in sys.modules, False)
+
+# plotting functions import matplotlib on first call --------------------------------------
+print '\nlazy plotting -------------------------------------------------------------------------'
+
+from tlga.output import SetForPng
+SetForPng()
+CheckVector('matplotlib imported', 'True', 'matplotlib' in sys.modules, True)
@@ -0,0 +1,41 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import time
+
+from numpy import array, arange, sort
+
+from tlga.randnums  import Seed, FltRand
+from tlga.operators import SimpleChromoPop, OrdChromoPop
+from tlga.testing   import CheckVector
+
+# initialise random numbers generator
+Seed(1234)
+
+# real-coded chromosomes ------------------------------------------------------------------
+print 'real-coded chromosomes ----------------------------------------------------------------'
+
+X = array([[5.0, 8.0, 7.0], [1.0, 2.0, 3.0]])
+C = SimpleChromoPop(X, 5)
+print 'C =\n', C
+CheckVector('shape', '(2, 15)', C.shape, (2, 15))
+CheckVector('sum of bases', 'X', abs(C.reshape(2, 3, 5).sum(axis=2) - X) < 1e-14, True)
+CheckVector('bases > 0', 'True', (C > 0).all(), True)
+
+ninds = 100000
+X = FltRand(ninds, 0.0, 10.0)
+t0 = time.time()
+C = SimpleChromoPop(X, 5)
+print 'time (ninds = %d) = %g' % (ninds, time.time() - t0)
+CheckVector('sum of bases', 'X', abs(C.sum(axis=1) - X) < 1e-13, True)
+
+# permutations ----------------------------------------------------------------------------
+print '\npermutations --------------------------------------------------------------------------'
+
+t0 = time.time()
+C = OrdChromoPop(ninds, 20)
+print 'time (ninds = %d) = %g' % (ninds, time.time() - t0)
+print 'C[:3] =\n', C[:3]
+CheckVector('shape', '(ninds, 20)', C.shape, (ninds, 20))
+CheckVector('sort(C)', '0..19', (sort(C, axis=1) == arange(20)).all(), True)
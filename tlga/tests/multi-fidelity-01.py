@@ -0,0 +1,85 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from numpy import pi, sin, cos, array
+
+from tlga.randnums  import Seed
+from tlga.operators import RealChromoPop, SBXCrossover, PolyMutation
+from tlga.solver    import Evolve
+from tlga.femaux    import MultiFidelity
+from tlga.testing   import CheckVector
+
+# initialise random numbers generator
+Seed(1234)
+
+# stand-in solver: the error decreases and the cost increases with the fidelity level
+COST = [1.0, 4.0, 16.0]
+def Solver(X, level):
+    err = 0.8 / 4.0**level
+    return -X * sin(X) + err * cos(5.0 * X)
+def y0(C): return Solver(C[:,0], 0)
+def y1(C): return Solver(C[:,0], 1)
+def y2(C): return Solver(C[:,0], 2)
+
+# levels and promotion --------------------------------------------------------------------
+print 'levels and promotion ------------------------------------------------------------------'
+
+mf = MultiFidelity([y0, y1, y2], frac=[0.5, 0.2], batch=True)
+C = RealChromoPop(40, [0.0], [4.0*pi])
+Y = mf.Evaluate(C)
+print 'neval =', mf.neval
+print 'L     =', mf.L
+CheckVector('neval', '40, 20, 4', mf.neval, [40, 20, 4])
+CheckVector('L == 2', 'Y == y2', Y[mf.L == 2], y2(C[mf.L == 2]))
+ok = True
+for l in range(2):
+    ok = ok and Y[mf.L == l].min() >= Y[mf.L > l].max()
+CheckVector('lower fidelity ranked below', 'True', ok, True)
+
+ncalls = [0]
+def yfine(c):
+    ncalls[0] += 1
+    return Solver(c[0], 1)
+mf = MultiFidelity([lambda c: Solver(c[0], 0), yfine], frac=0.25)
+Y = mf.Evaluate(C)
+CheckVector('ncalls (not batch)', '10', ncalls[0], 10)
+
+mf = MultiFidelity([y0, y1, y2], frac=1, batch=True)
+Y = mf.Evaluate(C)
+CheckVector('frac=1 (int)', 'all at highest level', mf.L, 2)
+try:
+    MultiFidelity([y0, y1, y2], frac=[0.5], batch=True)
+    raised = False
+except Exception:
+    raised = True
+CheckVector('short list of fractions', 'Exception', raised, True)
+
+# sin function ----------------------------------------------------------------------------
+print '\nsin function --------------------------------------------------------------------------'
+
+xmin, xmax = 0.0, 4.0*pi
+def xFcn(c): return str(c[0])
+def cxFcn(A, B): return SBXCrossover(A, B, xmin, xmax, 0.9)
+def muFcn(C):    return PolyMutation(C, xmin, xmax, 1.0)
+
+ninds, ngen = 20, 30
+mf = MultiFidelity([y0, y1, y2], frac=0.4, batch=True)
+C = RealChromoPop(ninds, [xmin], [xmax])
+C, Y, OV = Evolve(C, xFcn, mf.Evaluate, cxFcn, muFcn, ngen, batch=True, vec=True)
+cost = (mf.neval * COST).sum()
+print 'neval =', mf.neval
+print 'cost  =', cost, ' (fine only: %g)' % (ninds * (ngen+1) * COST[-1])
+print 'best: x =', C[0][0], ' y =', Y[0]
+CheckVector('best at highest fidelity', 'True', abs(Y[0] - y2(C[:1])[0]) < 1e-12, True)
+x = C[0][0]
+CheckVector('true y ~ -7.9167', 'True', abs(-x * sin(x) + 7.9167) < 0.01, True)
+CheckVector('cost', '< 1/3 of fine only', cost < ninds * (ngen+1) * COST[-1] / 3.0, True)
+
+# values depend on the call: no caching
+try:
+    Evolve(C, xFcn, mf.Evaluate, cxFcn, muFcn, 1, batch=True, vec=True, dup='copy')
+    raised = False
+except Exception:
+    raised = True
+CheckVector('MultiFidelity with dup', 'Exception', raised, True)
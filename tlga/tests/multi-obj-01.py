@@ -0,0 +1,49 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from numpy import array, inf, column_stack
+
+from tlga.randnums  import Seed, FltRand
+from tlga.operators import SimpleChromo, FltCrossover, FltMutation
+from tlga.operators import NonDominatedSort, CrowdingDistance
+from tlga.solver    import EvolveMO
+from tlga.testing   import CheckVector
+
+# initialise random numbers generator
+Seed(1234)
+
+# fronts and crowding distances -----------------------------------------------------------
+print 'fronts and crowding distances -----------------------------------------------------------'
+
+Y = array([[1,5], [2,3], [3,1], [2,4], [4,4], [3,3]], dtype=float)
+R = NonDominatedSort(Y)
+D = CrowdingDistance(Y, R)
+print 'R =', R
+print 'D =', D
+CheckVector('R', 'Rcor', R, [0, 0, 0, 1, 2, 1])
+CheckVector('D', 'Dcor', D, [inf, 2, inf, inf, inf, inf])
+
+# Schaffer problem: minimise x^2 and (x-2)^2 ----------------------------------------------
+print '\nSchaffer problem ----------------------------------------------------------------------'
+
+ninds  = 40
+nbases = 4
+ngen   = 30
+
+def oFcn(C):
+    X = C.sum(axis=1)
+    return column_stack([X**2.0, (X-2.0)**2.0])
+
+def cxFcn(A, B): return FltCrossover(A, B, 0.8)
+def muFcn(c):    return FltMutation(c, 0.05)
+
+C = [SimpleChromo(x, nbases) for x in FltRand(ninds, -2.0, 4.0)]
+C, Y, Cp, Yp = EvolveMO(C, oFcn, cxFcn, muFcn, ngen)
+Xp = Cp.sum(axis=1)
+print 'size of Pareto front =', len(Cp)
+print 'min(x), max(x) in front =', min(Xp), max(Xp)
+CheckVector('Yp', 'Y[:len(Yp)]', Yp, Y[:len(Yp)])
+CheckVector('front is non-dominated', 'True', (NonDominatedSort(Yp) == 0).all(), True)
+CheckVector('0 <= x <= 2', 'True', ((Xp > -0.05) & (Xp < 2.05)).all(), True)
+CheckVector('size of front > ninds/2', 'True', len(Cp) > ninds/2, True)
@@ -0,0 +1,81 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from numpy import array, arange, sort, sqrt, roll, vstack
+
+from tlga.randnums  import Seed, FltRandArray
+from tlga.operators import OrdChromoPop, OrdCrossover, OrdCrossoverPop, OrdMutation
+from tlga.adaptive  import OrdEdges
+from tlga.solver    import Evolve
+from tlga.testing   import CheckVector
+
+# initialise random numbers generator
+Seed(1234)
+
+# PMX -------------------------------------------------------------------------------------
+print 'PMX -------------------------------------------------------------------------------------'
+
+A = array([1,2,3,4,5,6,7,8,9], dtype=int)
+B = array([9,3,7,8,2,6,5,1,4], dtype=int)
+a, b = OrdCrossover(A, B, pc=1, method='PMX', cut1=3, cut2=7)
+print 'a =', a
+print 'b =', b
+CheckVector('a', 'a_sol', a, [9,3,2,4,5,6,7,1,8])
+CheckVector('b', 'b_sol', b, [1,7,3,8,2,6,5,4,9])
+
+# ERX -------------------------------------------------------------------------------------
+print '\nERX -------------------------------------------------------------------------------------'
+
+a, b = OrdCrossover(A, B, pc=1, method='ERX')
+print 'a =', a
+print 'b =', b
+CheckVector('a[0], b[0]', 'A[0], B[0]', [a[0], b[0]], [A[0], B[0]])
+CheckVector('sort(a)', '123456789', sort(a), arange(1, 10))
+CheckVector('sort(b)', '123456789', sort(b), arange(1, 10))
+
+# batched crossover: valid permutations ---------------------------------------------------
+print '\nbatched crossover ---------------------------------------------------------------------'
+
+npairs, nbases = 500, 50
+C = OrdChromoPop(2*npairs, nbases)
+A, B = C[:npairs], C[npairs:]
+for method in ['PMX', 'ERX', 'OX1']:
+    a, b = OrdCrossoverPop(A, B, 1.0, method)
+    ok = (sort(a, axis=1) == arange(nbases)).all() and (sort(b, axis=1) == arange(nbases)).all()
+    CheckVector('%s: permutations' % method, 'True', ok, True)
+    a, b = OrdCrossoverPop(A, B, 0.0, method)
+    CheckVector('%s: pc=0' % method, 'parents', vstack([a, b]), C)
+
+# ratio of edges of offspring inherited from parents
+a, b = OrdCrossoverPop(A, B, 1.0, 'ERX')
+nerx = 0
+for k in range(npairs):
+    E = OrdEdges(vstack([A[k], B[k]])) > 0
+    nerx += (OrdEdges(a[k:k+1]) * E).sum()
+print 'inherited edges: ERX =', nerx / float(npairs*nbases)
+CheckVector('ERX: inherited edges', '> 95%', nerx > 0.95 * npairs * nbases, True)
+
+# travelling salesman ---------------------------------------------------------------------
+print '\ntravelling salesman -------------------------------------------------------------------'
+
+ncities = 30
+X = FltRandArray((ncities, 2))
+def oFcn(c):
+    D = X[c] - X[roll(c, -1)]
+    return sqrt((D**2.0).sum(axis=1)).sum()
+def xFcn(c): return str(c)
+def muFcn(C): return array([OrdMutation(c, 0.1) for c in C])
+
+ninds, ngen = 40, 40
+best = {}
+for method in ['OX1', 'PMX', 'ERX']:
+    Seed(1234)
+    def cxFcn(A, B): return OrdCrossoverPop(A, B, 0.8, method)
+    C = OrdChromoPop(ninds, ncities)
+    C, Y, OV = Evolve(C, xFcn, oFcn, cxFcn, muFcn, ngen, vec=True)
+    best[method] = Y[0]
+    print '%s: best length = %g' % (method, Y[0])
+    ok = (sort(C, axis=1) == arange(ncities)).all()
+    CheckVector('%s: permutations' % method, 'True', ok, True)
+CheckVector('ERX: best length', '< OX1', best['ERX'] < best['OX1'], True)
@@ -0,0 +1,54 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import time
+
+from numpy import array, cumsum
+from pylab import subplot, gca
+
+from tlga.randnums  import Seed, FltRand
+from tlga.operators import Fitness, FltCrossover
+from tlga.output    import PlotProbBins, DrawCrossover, SetForPng, Save
+from tlga.testing   import CheckVector
+
+# initialise random numbers generator
+Seed(1234)
+
+# small population: one bin and one label per individual ----------------------------------
+print 'small population ----------------------------------------------------------------------'
+
+P = array([0.3, 0.25, 0.2, 0.15, 0.1])
+SetForPng()
+PlotProbBins(range(len(P)), P)
+CheckVector('ncollections', '1', len(gca().collections), 1)
+CheckVector('ntexts', '5', len(gca().texts), 5)
+
+# large population ------------------------------------------------------------------------
+print '\nlarge population ----------------------------------------------------------------------'
+
+ninds = 5000
+F = Fitness(FltRand(ninds))
+F.sort()
+P = F[::-1] / sum(F)
+SetForPng()
+t0 = time.time()
+PlotProbBins(FltRand(ninds), P)
+Save('/tmp/tlga-plot-01a.png')
+print 'time =', time.time() - t0
+CheckVector('ncollections', '1', len(gca().collections), 1)
+CheckVector('ntexts<=50', 'True', len(gca().texts) <= 50, True)
+
+# long chromosomes ------------------------------------------------------------------------
+print '\nlong chromosomes ----------------------------------------------------------------------'
+
+nbases = 500
+A, B = FltRand(nbases), FltRand(nbases)
+a, b = FltCrossover(A, B, pc=1)
+SetForPng()
+t0 = time.time()
+DrawCrossover(A, B, a, b, nbases/2)
+Save('/tmp/tlga-plot-01b.png')
+print 'time =', time.time() - t0
+CheckVector('ncollections', '4', len(gca().collections), 4)
+CheckVector('ntexts', '4', len(gca().texts), 4)
@@ -0,0 +1,66 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from numpy import pi, sin, array
+
+from tlga.randnums  import Seed, FltRand
+from tlga.operators import RealChromoPop, SBXCrossover, PolyMutation
+from tlga.operators import SimpleChromo, FltCrossover, FltMutation
+from tlga.solver    import Evolve
+from tlga.testing   import CheckVector
+
+# initialise random numbers generator
+Seed(1234)
+
+# operators -------------------------------------------------------------------------------
+print 'operators -----------------------------------------------------------------------------'
+
+xmin, xmax = [0.0, -1.0, 10.0], [1.0, 1.0, 20.0]
+A = RealChromoPop(1000, xmin, xmax)
+B = RealChromoPop(1000, xmin, xmax)
+CheckVector('xmin <= A <= xmax', 'True', ((A >= xmin) & (A <= xmax)).all(), True)
+
+a, b = SBXCrossover(A, B, xmin, xmax, pc=1.0, pv=1.0)
+CheckVector('xmin <= a,b <= xmax', 'True', ((a >= xmin) & (a <= xmax) & (b >= xmin) & (b <= xmax)).all(), True)
+# far bounds: spread factor is the same for both offspring
+a, b = SBXCrossover(A, B, -1e3, 1e3, pc=1.0, pv=1.0)
+CheckVector('a+b == A+B', 'True', (abs(a + b - A - B) < 1e-10).all(), True)
+
+a, b = SBXCrossover(A, B, xmin, xmax, pc=0.0)
+CheckVector('a (pc=0)', 'A', a, A)
+
+c = PolyMutation(A, xmin, xmax, pm=0.5)
+nmut = (c != A).sum()
+print 'number of mutated bases =', nmut, 'of', A.size
+CheckVector('xmin <= c <= xmax', 'True', ((c >= xmin) & (c <= xmax)).all(), True)
+CheckVector('about half mutated', 'True', abs(nmut - A.size / 2) < A.size / 10, True)
+
+a, b = SBXCrossover(A[0], B[0], xmin, xmax, pc=1.0)
+CheckVector('single chromosome', 'shape', a.shape, (3,))
+
+# sin function: direct encoding vs split bases --------------------------------------------
+print '\nsin function --------------------------------------------------------------------------'
+
+ncalls = [0]
+def oFcn(c):
+    ncalls[0] += 1
+    return -sum(c) * sin(sum(c))
+def xFcn(c): return str(sum(c))
+
+ninds, ngen = 20, 30
+xmin, xmax = 0.0, 4.0*pi
+def cxFcn(A, B): return SBXCrossover(A, B, xmin, xmax, 0.9)
+def muFcn(C):    return PolyMutation(C, xmin, xmax, 1.0)
+C = RealChromoPop(ninds, [xmin], [xmax])
+C, Y, OV = Evolve(C, xFcn, oFcn, cxFcn, muFcn, ngen, vec=True)
+print 'direct: best x =', C[0][0], ' y =', Y[0], ' nbases =', len(C[0])
+CheckVector('ncalls', 'ninds*(ngen+1)', ncalls[0], ninds*(ngen+1))
+CheckVector('xmin <= x <= xmax', 'True', xmin <= C[0][0] <= xmax, True)
+CheckVector('y ~ -7.9167', 'True', abs(Y[0] + 7.9167) < 1e-3, True)
+
+def cxFcn(A, B): return FltCrossover(A, B, 0.8)
+def muFcn(c):    return FltMutation(c, 0.01)
+C = [SimpleChromo(x, 5) for x in FltRand(ninds, xmin, xmax)]
+C, Y, OV = Evolve(C, xFcn, oFcn, cxFcn, muFcn, ngen)
+print 'split:  best x =', sum(C[0]), ' y =', Y[0], ' nbases =', len(C[0])
@@ -0,0 +1,74 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import os
+
+from numpy import pi, sin, array
+
+from tlga.randnums  import Seed, FltRand
+from tlga.operators import SimpleChromo, FltCrossover, FltMutation
+from tlga.solver    import Evolve
+from tlga.remote    import StartLocalWorkers, Coordinator
+from tlga.testing   import CheckVector
+
+# objective functions
+def oFcn(c):   return -sum(c) * sin(sum(c))
+def dieFcn(c): os._exit(1) # simulates a worker that disconnects
+def badFcn(C):
+    if (C.sum(axis=1) > 1e3).any(): raise Exception('cannot compute')
+    return -C.sum(axis=1) * sin(C.sum(axis=1))
+
+# workers on localhost
+procs1, addrs1 = StartLocalWorkers(oFcn, 3)
+procs2, addrs2 = StartLocalWorkers(dieFcn, 1)
+procs3, addrs3 = StartLocalWorkers(badFcn, 2, batch=True)
+
+# evaluate with one worker dying ----------------------------------------------------------
+print 'worker disconnects --------------------------------------------------------------------'
+
+Seed(1234)
+C = array([SimpleChromo(x, 5) for x in FltRand(50, 0.0, 4.0*pi)])
+Ycor = array([oFcn(c) for c in C])
+coord = Coordinator(addrs2 + addrs1, chunksize=7)
+Y = coord.Evaluate(C)
+print 'number of live workers =', len(coord.socks)
+CheckVector('Y', 'Ycor', Y, Ycor)
+CheckVector('number of live workers', '3', len(coord.socks), 3)
+
+# run GA with remote evaluations ----------------------------------------------------------
+print '\nremote evaluations with Evolve ----------------------------------------------------------'
+
+def xFcn(c):     return str(sum(c))
+def cxFcn(A, B): return FltCrossover(A, B, 0.8)
+def muFcn(c):    return FltMutation(c, 0.01)
+
+Seed(1234)
+C = [SimpleChromo(x, 5) for x in FltRand(20, 0.0, 4.0*pi)]
+C0, Y0, OV0 = Evolve(C, xFcn, oFcn, cxFcn, muFcn, 20)
+Seed(1234)
+C = [SimpleChromo(x, 5) for x in FltRand(20, 0.0, 4.0*pi)]
+C1, Y1, OV1 = Evolve(C, xFcn, coord.Evaluate, cxFcn, muFcn, 20, batch=True)
+coord.Close()
+print 'OV =', OV1
+CheckVector('OV(remote)', 'OV(serial)', OV1, OV0)
+
+# errors ----------------------------------------------------------------------------------
+print '\nerrors ----------------------------------------------------------------------------------'
+
+coord = Coordinator(addrs3)
+CheckVector('Y', 'Ycor', coord.Evaluate(C1), Y1)
+C1[3,0] = 2e3
+try:
+    coord.Evaluate(C1)
+    msg = ''
+except Exception as e:
+    msg = str(e)
+print 'msg =', msg
+CheckVector('msg', 'ERROR: ...', msg, 'ERROR: Exception: cannot compute')
+C1[3,0] = 0.0
+CheckVector('Y (after error)', 'Ycor', coord.Evaluate(C1[:10]), [oFcn(c) for c in C1[:10]])
+coord.Close()
+
+# stop workers
+for p in procs1 + procs2 + procs3: p.terminate()
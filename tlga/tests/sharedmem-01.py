@@ -0,0 +1,62 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+import os
+
+from numpy import pi, sin, array
+
+from tlga.randnums  import Seed, FltRand
+from tlga.operators import SimpleChromo, FltCrossover, FltMutation
+from tlga.solver    import Evolve
+from tlga.parallel  import SharedEvaluator
+from tlga.testing   import CheckVector
+
+# objective functions
+def oFcn(c):   return -sum(c) * sin(sum(c))
+def pidFcn(c): return os.getpid()
+def badFcn(c):
+    if sum(c) > 6.0: raise Exception('cannot compute')
+    return sum(c)
+
+ninds, nbases, ngen = 20, 5, 20
+def xFcn(c):     return str(sum(c))
+def cxFcn(A, B): return FltCrossover(A, B, 0.8)
+def muFcn(c):    return FltMutation(c, 0.01)
+
+# evaluations on worker processes ---------------------------------------------------------
+print 'worker processes ----------------------------------------------------------------------'
+
+Seed(1234)
+C = array([SimpleChromo(x, nbases) for x in FltRand(ninds, 0.0, 4.0*pi)])
+with SharedEvaluator(pidFcn, ninds, nbases, nproc=3) as ev:
+    P = ev.Evaluate(C)
+print 'pids =', P
+CheckVector('pid of workers != pid of main', 'True', (P != os.getpid()).all(), True)
+
+# run GA with shared memory evaluations ---------------------------------------------------
+print '\nEvolve --------------------------------------------------------------------------------'
+
+Seed(1234)
+C = [SimpleChromo(x, nbases) for x in FltRand(ninds, 0.0, 4.0*pi)]
+C0, Y0, OV0 = Evolve(C, xFcn, oFcn, cxFcn, muFcn, ngen)
+Seed(1234)
+C = [SimpleChromo(x, nbases) for x in FltRand(ninds, 0.0, 4.0*pi)]
+with SharedEvaluator(oFcn, ninds, nbases, nproc=3) as ev:
+    C1, Y1, OV1 = Evolve(C, xFcn, ev.Evaluate, cxFcn, muFcn, ngen, batch=True)
+print 'OV =', OV1
+CheckVector('OV(shared)', 'OV(serial)', OV1, OV0)
+CheckVector('pool closed', 'True', ev.pool == None, True)
+
+# errors ----------------------------------------------------------------------------------
+print '\nerrors ----------------------------------------------------------------------------------'
+
+try:
+    with SharedEvaluator(badFcn, ninds, nbases, nproc=2) as ev:
+        ev.Evaluate(C1)
+    msg = ''
+except Exception as e:
+    msg = str(e)
+print 'msg =', msg
+CheckVector('msg', 'ERROR: ...', msg, 'ERROR: Exception: cannot compute')
+CheckVector('pool closed', 'True', ev.pool == None, True)
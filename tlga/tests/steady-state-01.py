@@ -0,0 +1,46 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from numpy import pi, sin, array
+
+from tlga.randnums  import Seed, FltRand, IntRand
+from tlga.operators import SimpleChromo, FltCrossover, FltMutation
+from tlga.solver    import EvolveSS
+from tlga.heap      import IndexedHeap
+from tlga.testing   import CheckVector
+
+# initialise random numbers generator
+Seed(1234)
+
+# indexed heap ----------------------------------------------------------------------------
+print 'indexed heap --------------------------------------------------------------------------'
+
+Y = FltRand(50)
+heap = IndexedHeap(Y)
+ok = True
+for k in range(500):
+    i = IntRand(0, 50)
+    Y[i] = FltRand(1, -1.0, 1.0)
+    heap.Update(i, Y[i])
+    if heap.Key(heap.Top()) != Y.max(): ok = False
+    if sorted(heap.pos) != range(50): ok = False
+CheckVector('top == max', 'True', ok, True)
+
+# sin function ----------------------------------------------------------------------------
+print '\nsin function --------------------------------------------------------------------------'
+
+ninds, nbases, nsteps = 20, 5, 100
+def xFcn(c):     return str(sum(c))
+def oFcn(c):     return -sum(c) * sin(sum(c))
+def cxFcn(A, B): return FltCrossover(A, B, 0.8)
+def muFcn(c):    return FltMutation(c, 0.01)
+
+C = [SimpleChromo(x, nbases) for x in FltRand(ninds, 0.0, 4.0*pi)]
+C, Y, OV = EvolveSS(C, xFcn, oFcn, cxFcn, muFcn, nsteps, nbatch=4)
+print 'OV[::10] =', OV[::10]
+print 'best: x =', xFcn(C[0]), ' y =', Y[0]
+CheckVector('OV non-increasing', 'True', (OV[1:] <= OV[:-1]).all(), True)
+CheckVector('Y sorted', 'True', (Y[1:] >= Y[:-1]).all(), True)
+CheckVector('Y[0]', 'OV[-1]', Y[0], OV[-1])
+CheckVector('Y', 'oFcn(C)', Y, [oFcn(c) for c in C])
@@ -0,0 +1,54 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from numpy import pi, sin, array, isnan
+
+from tlga.randnums  import Seed, FltRand
+from tlga.operators import SimpleChromo, FltCrossover, FltMutation
+from tlga.solver    import Evolve
+from tlga.surrogate import KnnSurrogate
+from tlga.history   import HistMemory
+from tlga.testing   import CheckVector
+
+# initialise random numbers generator
+Seed(1234)
+
+# nearest neighbours ----------------------------------------------------------------------
+print 'nearest neighbours --------------------------------------------------------------------'
+
+X = array([[0.0, 0.0], [1.0, 0.0], [0.0, 1.0], [1.0, 1.0]])
+Y = array([0.0, 1.0, 2.0, 3.0])
+surr = KnnSurrogate(k=2, maxsize=3)
+surr.Add(X, Y) # the first pair is overwritten
+print 'archive =', surr.Y
+CheckVector('size', '3', surr.size, 3)
+CheckVector('archive', 'Y[1:]', sorted(surr.Y), [1, 2, 3])
+Yp = surr.Predict([[1.0, 0.0], [0.5, 1.0]])
+print 'Yp =', Yp
+CheckVector('Yp', 'Ycor', abs(Yp - [1.0, 2.5]) < 1e-10, True)
+
+# sin function ----------------------------------------------------------------------------
+print '\nsin function --------------------------------------------------------------------------'
+
+ncalls = [0]
+def oFcn(c):
+    ncalls[0] += 1
+    return -sum(c) * sin(sum(c))
+
+ninds, nbases, ngen = 20, 5, 30
+def xFcn(c):     return str(sum(c))
+def cxFcn(A, B): return FltCrossover(A, B, 0.8)
+def muFcn(c):    return FltMutation(c, 0.01)
+
+C = [SimpleChromo(x, nbases) for x in FltRand(ninds, 0.0, 4.0*pi)]
+hist = HistMemory()
+C, Y, OV = Evolve(C, xFcn, oFcn, cxFcn, muFcn, ngen, hist=hist, surr=KnnSurrogate(), surrFrac=0.25)
+print 'ncalls =', ncalls[0]
+print 'serr   =', hist.Get('serr')
+print 'best: x =', xFcn(C[0]), ' y =', Y[0]
+CheckVector('ncalls', 'sum(neval)', ncalls[0], hist.Get('neval').sum())
+CheckVector('ncalls', 'ninds+ngen*ninds/4', ncalls[0], ninds+ngen*ninds/4)
+CheckVector('Y[0]', 'oFcn(C[0])', Y[0], -sum(C[0]) * sin(sum(C[0])))
+CheckVector('serr computed', 'True', (~isnan(hist.Get('serr')[1:])).all(), True)
+CheckVector('OV non-increasing', 'True', (OV[1:] <= OV[:-1]).all(), True)
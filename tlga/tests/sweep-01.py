@@ -0,0 +1,46 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from numpy import pi, sin
+
+from tlga.randnums  import Seed, FltRand
+from tlga.operators import SimpleChromo, FltCrossover, FltMutation
+from tlga.solver    import Evolve
+from tlga.sweep     import SweepGrid, Sweep
+from tlga.testing   import CheckVector
+
+# problem definition for one run
+def setup(prm):
+    def xFcn(c):     return str(sum(c))
+    def oFcn(c):     return -sum(c) * sin(sum(c))
+    def cxFcn(A, B): return FltCrossover(A, B, prm['pc'])
+    def muFcn(c):    return FltMutation(c, prm['pm'])
+    C = [SimpleChromo(x, 5) for x in FltRand(20, 0.0, 4.0*pi)]
+    return C, xFcn, oFcn, cxFcn, muFcn
+
+# grid ------------------------------------------------------------------------------------
+print 'grid ----------------------------------------------------------------------------------'
+
+P = SweepGrid(range(4), pc=[0.6, 0.8], pm=[0.01], rnk=[False, True])
+print 'number of runs =', len(P)
+CheckVector('number of runs', '16', len(P), 16)
+CheckVector('P[5]', 'prm', sorted(P[5].items()), sorted(dict(seed=1, pc=0.6, pm=0.01, rnk=True).items()))
+
+# sweep -----------------------------------------------------------------------------------
+print '\nsweep ---------------------------------------------------------------------------------'
+
+ngen = 15
+OV, res = Sweep(setup, P, ngen, nproc=4)
+OVs, ress = Sweep(setup, P, ngen, nproc=1)
+for r in res:
+    print 'pc = %g, rnk = %-5s: nruns = %d, mean = %g, std = %g' % (r['pc'], r['rnk'], r['nruns'], r['mean'], r['std'])
+CheckVector('shape of OV', '(16, ngen+1)', OV.shape, (16, ngen+1))
+CheckVector('OV(parallel)', 'OV(serial)', OV, OVs)
+CheckVector('number of settings', '4', len(res), 4)
+
+# compare with Evolve
+Seed(P[5]['seed'])
+C, xFcn, oFcn, cxFcn, muFcn = setup(P[5])
+C, Y, OV5 = Evolve(C, xFcn, oFcn, cxFcn, muFcn, ngen, rnk=True)
+CheckVector('OV[5]', 'OV(Evolve)', OV[5], OV5)
@@ -0,0 +1,50 @@
+# Copyright 2012 Dorival de Moraes Pedroso. All rights reserved.
+# Use of this source code is governed by a BSD-style
+# license that can be found in the LICENSE file.
+
+from numpy import pi, sin, array, bincount
+
+from tlga.randnums  import Seed, FltRand
+from tlga.operators import TournamentSelect, SimpleChromo, FltCrossover, FltMutation
+from tlga.solver    import Evolve
+from tlga.testing   import CheckVector
+
+# initialise random numbers generator
+Seed(1234)
+
+# tournament selection --------------------------------------------------------------------
+print 'tournament selection ------------------------------------------------------------------'
+
+F = array([0.2, 1.0, 0.0, 0.6, 0.4, 0.8])
+
+S = TournamentSelect(F, 6, k=6, replace=False)
+print 'S(k=6, no replacement) =', S
+CheckVector('S', 'best', S, [1, 1, 1, 1, 1, 1])
+
+S = TournamentSelect(F, 600, k=2, replace=False)
+N = bincount(S, minlength=6)
+print 'number of selections (k=2, no replacement) =', N
+CheckVector('N(worst)', '0', N[2], 0)
+CheckVector('N(best)', '200', N[1], 200)
+
+S = TournamentSelect(F, 600, k=3)
+N = bincount(S, minlength=6)
+print 'number of selections (k=3, replacement)    =', N
+CheckVector('mean(F[S]) > mean(F)', 'True', F[S].mean() > F.mean(), True)
+
+# sin function ----------------------------------------------------------------------------
+print '\nsin function --------------------------------------------------------------------------'
+
+ninds, nbases, ngen = 20, 5, 30
+def xFcn(c):     return str(sum(c))
+def oFcn(c):     return -sum(c) * sin(sum(c))
+def cxFcn(A, B): return FltCrossover(A, B, 0.8)
+def muFcn(c):    return FltMutation(c, 0.01)
+
+C = [SimpleChromo(x, nbases) for x in FltRand(ninds, 0.0, 4.0*pi)]
+C, Y, OV = Evolve(C, xFcn, oFcn, cxFcn, muFcn, ngen, trn=True, trnK=3)
+print 'OV =', OV
+print 'best: x =', xFcn(C[0]), ' y =', Y[0]
+CheckVector('OV non-increasing', 'True', (OV[1:] <= OV[:-1]).all(), True)
+CheckVector('Y sorted', 'True', (Y[1:] >= Y[:-1]).all(), True)
+CheckVector('Y[0]', 'OV[-1]', Y[0], OV[-1])